@@ -7,6 +7,8 @@ signal game_paused
 signal game_resumed
 signal level_completed(level_name: String)
 signal score_changed(new_score: int)
+signal coin_collected(coin_name: String)
+signal scene_ready(nodes: Dictionary)
 
 @onready var player: CharacterBody2D = $Player
 @onready var hud: CanvasLayer = $HUD
@@ -30,6 +32,15 @@ func _ready() -> void:
 	player.collected.connect(_on_player_collected)
 	player.died.connect(_on_player_died)
 
+	# Announce the interesting top-level nodes in one signal so tests
+	# can wait once instead of polling each path separately
+	scene_ready.emit({
+		"main": str(get_path()),
+		"player": str(player.get_path()),
+		"hud": str(hud.get_path()),
+		"coins": str($Coins.get_path()),
+	})
+
 
 func _count_coins() -> void:
 	"""Count total coins in level."""
@@ -157,6 +168,7 @@ func _on_player_collected(item_name: String) -> void:
 	if item_name == "coin":
 		add_score(100)
 		_update_hud()
+		coin_collected.emit(item_name)
 		if is_level_complete():
 			level_completed.emit(level_name)
 
@@ -15,9 +15,11 @@ const GRAVITY = 980.0
 var coins_collected: int = 0
 var is_alive: bool = true
 var _was_on_floor: bool = false
+var _physics_ticked: bool = false
 
 
 func _physics_process(delta: float) -> void:
+	_physics_ticked = true
 	if not is_alive:
 		return
 
@@ -67,6 +69,11 @@ func get_velocity_y() -> float:
 	return velocity.y
 
 
+func is_ready() -> bool:
+	"""Check if the player has processed at least one physics frame."""
+	return is_inside_tree() and _physics_ticked
+
+
 func is_grounded() -> bool:
 	"""Check if player is on the floor."""
 	return is_on_floor()
@@ -4,70 +4,226 @@ Demonstrates proper test setup patterns for PlayGodot.
 """
 
 import asyncio
+import os
+from contextlib import AsyncExitStack
 from pathlib import Path
 
 import pytest
 import pytest_asyncio
 
-from playgodot import Godot
+from playgodot import Godot, TimeoutError
+
+# The suite is I/O-bound on one socket to Godot; uvloop noticeably cuts
+# per-await overhead when available, and the default loop is fine without it.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the suite on uvloop when installed (pytest-asyncio hook).
+
+    Scoping the policy to this fixture keeps the global asyncio policy
+    untouched for anything else sharing the process.
+    """
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 # Get the path to the Godot project
 GODOT_PROJECT = Path(__file__).parent.parent / "godot"
 
+# Number of warm Godot processes kept alive for the whole session.
+GODOT_POOL_SIZE = int(os.environ.get("GODOT_POOL_SIZE", "2"))
 
-@pytest_asyncio.fixture
-async def game():
-    """Launch the platformer game and provide a Godot instance.
 
-    This fixture:
-    - Launches Godot in headless mode
-    - Waits for the main scene to be ready
-    - Yields the game instance for testing
-    - Cleans up after the test
+@pytest.fixture(scope="session")
+def worker_id(request):
+    """The pytest-xdist worker id, or "master" when xdist is not in use.
+
+    Overridden here so the suite also runs without pytest-xdist
+    installed; under xdist the real worker id is read from the config.
     """
-    async with Godot.launch(
-        GODOT_PROJECT,
-        headless=True,
-        resolution=(800, 600),
-        timeout=30.0,
-    ) as g:
-        # Wait for the main scene and player to be ready
+    if hasattr(request.config, "workerinput"):
+        return request.config.workerinput["workerid"]
+    return "master"
+
+
+def _debugger_port(worker_id: str, slot: int = 0) -> int:
+    """Give each xdist worker its own range of debugger ports.
+
+    Each worker owns GODOT_POOL_SIZE pooled instances plus one slot for
+    fresh_game, so ranges must not collide when running
+    `pytest -n auto --dist=loadfile`.
+    """
+    if worker_id == "master":
+        index = 0
+    else:
+        index = 1 + int(worker_id.lstrip("gw"))
+    return 6007 + (GODOT_POOL_SIZE + 1) * index + slot
+
+
+def _player_ready(g):
+    """Predicate for game.wait_for(): player has had a physics tick.
+
+    Replaces a fixed asyncio.sleep(0.1) after scene (re)loads; the probe
+    returns as soon as the player has actually processed a physics frame.
+    """
+    async def _is_ready():
+        return await g.call("/root/Main/Player", "is_ready")
+
+    return _is_ready
+
+
+async def _wait_scene_ready(g):
+    """Wait once for the aggregate scene_ready signal from Main.
+
+    One signal wait replaces a wait_for_node round-trip per path, and it
+    seeds the node cache so later wait_for_node calls are free. Falls
+    back to per-node waits if the scene finished loading before the
+    waiter registered.
+    """
+    try:
+        await g.wait_for_scene_ready(source="/root/Main", timeout=2.0)
+    except TimeoutError:
         await g.wait_for_node("/root/Main")
         await g.wait_for_node("/root/Main/Player")
 
-        # Small delay to ensure physics is initialized
-        await asyncio.sleep(0.1)
 
+class _GodotPool:
+    """Pool of warm Godot processes shared across the session.
+
+    Launching a headless Godot dominates suite runtime, so instances are
+    returned to the pool with their scene reloaded rather than torn
+    down; after session start no test pays the process-launch cost.
+    """
+
+    def __init__(self) -> None:
+        self._available: asyncio.Queue[Godot] = asyncio.Queue()
+        self._stack = AsyncExitStack()
+        self._worker_id = "master"
+        self._slots: dict[Godot, int] = {}
+
+    async def _launch_slot(self, slot: int) -> Godot:
+        """Launch one instance into `slot` and wait for it to be ready."""
+        g = await self._stack.enter_async_context(
+            Godot.launch(
+                GODOT_PROJECT,
+                headless=True,
+                resolution=(800, 600),
+                port=_debugger_port(self._worker_id, slot),
+                timeout=30.0,
+            )
+        )
+        await _wait_scene_ready(g)
+        await g.wait_for(_player_ready(g), timeout=2.0, interval=0.01)
+        self._slots[g] = slot
+        return g
+
+    async def start(self, worker_id: str, size: int) -> None:
+        """Launch `size` instances and wait for each to be ready."""
+        self._worker_id = worker_id
+        for slot in range(size):
+            self._available.put_nowait(await self._launch_slot(slot))
+
+    async def acquire(self) -> Godot:
+        """Take a ready instance; scene state is already clean."""
+        return await self._available.get()
+
+    async def release(self, g: Godot) -> None:
+        """Return an instance, restoring a clean scene for the next test."""
+        slot = self._slots.get(g, 0)
+        try:
+            # Engine-global state survives reload_scene, so reset it
+            # first: a test that failed mid-way may have left the tree
+            # paused or time-scaled, which would wedge the readiness wait.
+            await g.unpause()
+            await g.set_time_scale(1.0)
+            await g.reload_scene()
+            await _wait_scene_ready(g)
+            await g.wait_for(_player_ready(g), timeout=2.0, interval=0.01)
+        except Exception:
+            # Never lose the slot: with a bounded pool, a dropped
+            # instance would block every later acquire() forever. Tear
+            # the wedged instance down and relaunch in its place.
+            self._slots.pop(g, None)
+            try:
+                await g.disconnect()
+            except Exception:
+                pass
+            g = await self._launch_slot(slot)
+        self._available.put_nowait(g)
+
+    async def aclose(self) -> None:
+        await self._stack.aclose()
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def _godot_pool(worker_id):
+    """Start the warm Godot pool once for the whole test session."""
+    pool = _GodotPool()
+    try:
+        await pool.start(worker_id, GODOT_POOL_SIZE)
+        yield pool
+    finally:
+        await pool.aclose()
+
+
+@pytest_asyncio.fixture
+async def game(_godot_pool):
+    """Provide a pooled game instance with a clean scene.
+
+    This fixture:
+    - Reuses a warm session-wide Godot instance (no per-test launch)
+    - Yields a freshly reloaded scene (the pool reloads on release)
+    """
+    g = await _godot_pool.acquire()
+    try:
         yield g
+    finally:
+        await _godot_pool.release(g)
+
+
+@pytest.fixture
+def player_grounded(game):
+    """Shared grounded predicate for game.wait_for().
+
+    Hoisted here so the movement/jump tests don't each define their own
+    is_grounded closure; a landed-signal wait is not usable because the
+    player is usually already on the ground when a test starts.
+    """
+    async def _is_grounded():
+        return await game.call("/root/Main/Player", "is_grounded")
+
+    return _is_grounded
 
 
 @pytest_asyncio.fixture
-async def game_with_player_grounded(game):
+async def game_with_player_grounded(game, player_grounded):
     """Fixture that ensures player starts on the ground.
 
     Waits for the player to land before yielding.
     """
-    # Wait until player is grounded
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=5.0)
+    await game.wait_for(player_grounded, timeout=5.0)
     return game
 
 
 @pytest_asyncio.fixture
-async def fresh_game():
+async def fresh_game(worker_id):
     """Launch a fresh game instance for each test.
 
-    Use this when you need complete isolation between tests.
+    Use this when you need complete isolation between tests; it bypasses
+    the pool and pays a full launch.
     """
     async with Godot.launch(
         GODOT_PROJECT,
         headless=True,
         resolution=(800, 600),
+        port=_debugger_port(worker_id, GODOT_POOL_SIZE),
     ) as g:
-        await g.wait_for_node("/root/Main")
-        await g.wait_for_node("/root/Main/Player")
-        await asyncio.sleep(0.1)
+        await _wait_scene_ready(g)
+        await g.wait_for(_player_ready(g), timeout=2.0, interval=0.01)
         yield g
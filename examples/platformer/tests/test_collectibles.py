@@ -11,6 +11,21 @@ import asyncio
 
 import pytest
 
+from playgodot import TimeoutError
+
+
+async def wait_for_coin_collected(game, timeout=1.0):
+    """Wait for the coin_collected signal, tolerating a miss.
+
+    Returns as soon as the physics tick actually resolves the pickup
+    instead of sleeping a fixed interval; a timeout just means the coin
+    wasn't collected and the test's assertions decide what that means.
+    """
+    try:
+        await game.wait_for_signal("coin_collected", source="/root/Main", timeout=timeout)
+    except TimeoutError:
+        pass
+
 
 @pytest.mark.asyncio
 async def test_collect_coin_by_position(game):
@@ -24,7 +39,7 @@ async def test_collect_coin_by_position(game):
     # Coin1 is at (250, 410) - on Platform1
     # Move player there
     await game.call("/root/Main/Player", "set_position_for_test", [250.0, 380.0])
-    await asyncio.sleep(0.3)  # Wait for physics/collision
+    await wait_for_coin_collected(game)
 
     final_coins = await game.call("/root/Main/Player", "get_coins")
     final_count = await game.call("/root/Main", "get_coin_count")
@@ -44,7 +59,7 @@ async def test_score_increases_on_collection(game):
 
     # Collect a coin
     await game.call("/root/Main/Player", "set_position_for_test", [400.0, 490.0])
-    await asyncio.sleep(0.3)
+    await wait_for_coin_collected(game)
 
     final_score = await game.call("/root/Main", "get_score")
 
@@ -62,7 +77,7 @@ async def test_coins_disappear_when_collected(game):
 
     # Collect coin at (700, 520)
     await game.call("/root/Main/Player", "set_position_for_test", [700.0, 490.0])
-    await asyncio.sleep(0.3)
+    await wait_for_coin_collected(game)
 
     final_count = await game.call("/root/Main", "get_coin_count")
 
@@ -74,11 +89,13 @@ async def test_coins_disappear_when_collected(game):
 async def test_remaining_coins_tracking(game):
     """Track remaining coins correctly.
 
-    Demonstrates: Inventory/collection tracking
+    Demonstrates: Inventory/collection tracking with batch()
     """
-    total = await game.call("/root/Main", "get_total_coins")
-    collected = await game.call("/root/Main/Player", "get_coins")
-    remaining = await game.call("/root/Main", "get_remaining_coins")
+    total, collected, remaining = await game.batch([
+        ("call", "/root/Main", "get_total_coins"),
+        ("call", "/root/Main/Player", "get_coins"),
+        ("call", "/root/Main", "get_remaining_coins"),
+    ])
 
     assert remaining == total - collected, \
         f"Remaining should be {total} - {collected} = {total - collected}, got {remaining}"
@@ -88,7 +105,7 @@ async def test_remaining_coins_tracking(game):
 async def test_collect_multiple_coins(game):
     """Collect multiple coins in sequence.
 
-    Demonstrates: Sequential game actions
+    Demonstrates: batch_pipeline() for multi-step interactions
     """
     # Coin positions:
     # Coin4: (700, 520) - ground level
@@ -96,15 +113,25 @@ async def test_collect_multiple_coins(game):
 
     initial_coins = await game.call("/root/Main/Player", "get_coins")
 
-    # Collect first ground coin
-    await game.call("/root/Main/Player", "set_position_for_test", [700.0, 490.0])
-    await asyncio.sleep(0.3)
-
-    mid_coins = await game.call("/root/Main/Player", "get_coins")
-
-    # Collect second ground coin
-    await game.call("/root/Main/Player", "set_position_for_test", [400.0, 490.0])
-    await asyncio.sleep(0.3)
+    # Teleport onto both ground coins with a physics frame between the
+    # moves - one round-trip instead of two teleport/sleep/read cycles
+    await game.batch_pipeline([
+        ("call", "/root/Main/Player", "set_position_for_test", [700.0, 490.0]),
+        ("await_frame",),
+        ("call", "/root/Main/Player", "set_position_for_test", [400.0, 490.0]),
+        ("await_frame",),
+        ("call", "/root/Main/Player", "get_coins"),
+    ])
+
+    # Collision resolution may take a few more frames
+    async def collected_coins():
+        coins = await game.call("/root/Main/Player", "get_coins")
+        return coins > initial_coins
+
+    try:
+        await game.wait_for(collected_coins, timeout=2.0)
+    except TimeoutError:
+        pass
 
     final_coins = await game.call("/root/Main/Player", "get_coins")
 
@@ -136,15 +163,12 @@ async def test_hud_shows_coin_progress(game):
 
 
 @pytest.mark.asyncio
-async def test_collect_coin_by_movement(game):
+async def test_collect_coin_by_movement(game, player_grounded):
     """Collect a coin by actually moving the player.
 
     Demonstrates: Natural gameplay testing (not teleporting)
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     initial_coins = await game.call("/root/Main/Player", "get_coins")
 
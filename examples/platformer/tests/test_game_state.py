@@ -15,6 +15,8 @@ import asyncio
 
 import pytest
 
+from playgodot import TimeoutError
+
 
 # =============================================================================
 # Property Access Tests
@@ -79,10 +81,10 @@ async def test_read_visibility(game):
 async def test_query_coins(game):
     """Query all coin nodes in the scene.
 
-    Demonstrates: query_nodes() with patterns
+    Demonstrates: query_children() for direct children
     """
     # Query for coin nodes
-    coins = await game.query_nodes("/root/Main/Coins/*")
+    coins = await game.query_children("/root/Main/Coins")
     assert len(coins) >= 1, "Should find coin nodes"
 
 
@@ -90,9 +92,9 @@ async def test_query_coins(game):
 async def test_count_coins(game):
     """Count collectible coins.
 
-    Demonstrates: count_nodes()
+    Demonstrates: count_children()
     """
-    count = await game.count_nodes("/root/Main/Coins/*")
+    count = await game.count_children("/root/Main/Coins")
     assert count == 5, f"Should have 5 coins initially, got {count}"
 
 
@@ -100,9 +102,9 @@ async def test_count_coins(game):
 async def test_query_platforms(game):
     """Query platform nodes.
 
-    Demonstrates: query_nodes() for level geometry
+    Demonstrates: query_children() for level geometry
     """
-    platforms = await game.query_nodes("/root/Main/Platforms/*")
+    platforms = await game.query_children("/root/Main/Platforms", depth=1)
     assert len(platforms) >= 3, "Should have multiple platforms"
 
 
@@ -110,12 +112,16 @@ async def test_query_platforms(game):
 async def test_get_tree_structure(game):
     """Get the scene tree structure.
 
-    Demonstrates: get_tree()
+    Demonstrates: get_tree() with a depth bound
     """
-    tree = await game.get_tree()
+    # Only the root's direct children are asserted on, so skip
+    # serializing the rest of the scene
+    tree = await game.get_tree(depth=1)
     assert tree is not None, "Should return tree structure"
-    # Tree should contain our main nodes
-    assert "Main" in str(tree) or "root" in str(tree).lower()
+    # Tree should contain our main nodes - check the typed fields
+    # instead of stringifying the whole structure
+    child_names = [child["name"] for child in tree.get("children", [])]
+    assert tree["name"] == "root" or "Main" in child_names
 
 
 # =============================================================================
@@ -124,26 +130,23 @@ async def test_get_tree_structure(game):
 
 
 @pytest.mark.asyncio
-async def test_initial_score(game):
-    """Game starts with zero score.
-
-    Demonstrates: call() for game state
-    """
-    score = await game.call("/root/Main", "get_score")
-    assert score == 0, "Should start with 0 score"
-
-
-@pytest.mark.asyncio
-async def test_initial_coin_count(game):
-    """Verify initial coin count.
+async def test_initial_state_snapshot(game):
+    """Initial score, coin counts and level name are all correct.
 
-    Demonstrates: Multiple call() invocations
+    Demonstrates: batch() for snapshot-style assertions - one RPC
+    instead of four, and one fixture setup instead of three tests
     """
-    total = await game.call("/root/Main", "get_total_coins")
-    remaining = await game.call("/root/Main", "get_remaining_coins")
+    score, total, remaining, level_name = await game.batch([
+        ("call", "/root/Main", "get_score"),
+        ("call", "/root/Main", "get_total_coins"),
+        ("call", "/root/Main", "get_remaining_coins"),
+        ("call", "/root/Main", "get_level_name"),
+    ])
 
+    assert score == 0, "Should start with 0 score"
     assert total == 5, f"Should have 5 total coins, got {total}"
     assert remaining == total, "All coins should remain at start"
+    assert level_name == "Level 1", f"Expected 'Level 1', got '{level_name}'"
 
 
 @pytest.mark.asyncio
@@ -157,16 +160,6 @@ async def test_player_state_api(game):
     assert state in valid_states, f"Invalid state: {state}"
 
 
-@pytest.mark.asyncio
-async def test_level_name(game):
-    """Get current level name.
-
-    Demonstrates: call() for metadata
-    """
-    name = await game.call("/root/Main", "get_level_name")
-    assert name == "Level 1", f"Expected 'Level 1', got '{name}'"
-
-
 # =============================================================================
 # Scene Management Tests
 # =============================================================================
@@ -190,13 +183,15 @@ async def test_reload_scene(game):
     """
     # Collect a coin first
     await game.call("/root/Main/Player", "set_position_for_test", [250.0, 380.0])
-    await asyncio.sleep(0.3)
+    try:
+        await game.wait_for_signal("coin_collected", source="/root/Main", timeout=1.0)
+    except TimeoutError:
+        pass  # The assertion below only needs the reload to restore coins
 
     initial_remaining = await game.call("/root/Main", "get_remaining_coins")
 
     # Reload scene
     await game.reload_scene()
-    await asyncio.sleep(0.5)
 
     # Wait for scene to be ready again
     await game.wait_for_node("/root/Main/Player")
@@ -270,20 +265,17 @@ async def test_time_scale(game):
     scale = await game.get_time_scale()
     assert scale == 2.0, "Should be at double speed"
 
-    # Restore normal speed
-    await game.set_time_scale(1.0)
+    # Restore normal speed (fire-and-forget, the ack is unused)
+    await game.set_time_scale(1.0, wait=False)
 
 
 @pytest.mark.asyncio
-async def test_time_scale_affects_physics(game):
+async def test_time_scale_affects_physics(game, player_grounded):
     """Time scale actually affects game physics.
 
     Demonstrates: Practical use of time scale
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     # Jump at double speed
     await game.set_time_scale(2.0)
@@ -297,8 +289,8 @@ async def test_time_scale_affects_physics(game):
     mid_y = await game.call("/root/Main/Player", "get_position_y")
     assert mid_y < initial_y, "Player should jump even with short wait at 2x speed"
 
-    # Restore
-    await game.set_time_scale(1.0)
+    # Restore (fire-and-forget, the ack is unused)
+    await game.set_time_scale(1.0, wait=False)
 
 
 # =============================================================================
@@ -62,22 +62,23 @@ async def test_player_moves_with_keyboard(game):
 
 
 @pytest.mark.asyncio
-async def test_player_jumps(game):
+async def test_player_jumps(game, player_grounded):
     """Player can jump with the jump action.
 
     Demonstrates: press_action(), call(), wait_for()
     """
-    # Wait for player to be grounded first
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     initial_y = await game.call("/root/Main/Player", "get_position_y")
 
-    # Press jump
+    # Register the signal waiter before pressing jump so the emission
+    # can't be missed, then trigger the jump
+    jumped = asyncio.create_task(
+        game.wait_for_signal("jumped", source="/root/Main/Player", timeout=2.0)
+    )
+    await asyncio.sleep(0)  # let the waiter register before the press
     await game.press_action("jump")
-    await asyncio.sleep(0.15)  # Wait for jump to take effect
+    await jumped
 
     # Player should be higher (lower Y value in Godot)
     mid_jump_y = await game.call("/root/Main/Player", "get_position_y")
@@ -85,37 +86,34 @@ async def test_player_jumps(game):
 
 
 @pytest.mark.asyncio
-async def test_player_jump_with_spacebar(game):
+async def test_player_jump_with_spacebar(game, player_grounded):
     """Player can jump using spacebar key.
 
     Demonstrates: press_key() for jump
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     initial_y = await game.call("/root/Main/Player", "get_position_y")
 
-    # Jump with spacebar
+    # Jump with spacebar, waiting on the jumped signal instead of sleeping
+    jumped = asyncio.create_task(
+        game.wait_for_signal("jumped", source="/root/Main/Player", timeout=2.0)
+    )
+    await asyncio.sleep(0)
     await game.press_key("space")
-    await asyncio.sleep(0.15)
+    await jumped
 
     current_y = await game.call("/root/Main/Player", "get_position_y")
     assert current_y < initial_y, "Spacebar should trigger jump"
 
 
 @pytest.mark.asyncio
-async def test_player_state_transitions(game):
+async def test_player_state_transitions(game, player_grounded):
     """Player state changes correctly during movement.
 
     Demonstrates: call() for state checking, hold_action()
     """
-    # Wait for grounded
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     # Check idle state
     state = await game.call("/root/Main/Player", "get_state")
@@ -128,41 +126,39 @@ async def test_player_state_transitions(game):
 
 
 @pytest.mark.asyncio
-async def test_jump_state_is_jumping(game):
+async def test_jump_state_is_jumping(game, player_grounded):
     """Player enters jumping state when jumping.
 
     Demonstrates: Sequential action testing
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
-    # Jump and check state immediately
+    # Jump, waiting on the jumped signal, then check state
+    jumped = asyncio.create_task(
+        game.wait_for_signal("jumped", source="/root/Main/Player", timeout=2.0)
+    )
+    await asyncio.sleep(0)
     await game.press_action("jump")
-    await asyncio.sleep(0.1)
+    await jumped
 
     is_jumping = await game.call("/root/Main/Player", "is_jumping")
     assert is_jumping, "Player should be in jumping state"
 
 
 @pytest.mark.asyncio
-async def test_player_falls_after_jump(game):
+async def test_player_falls_after_jump(game, player_grounded):
     """Player falls back down after jumping.
 
     Demonstrates: Waiting for physics state changes
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
     initial_y = await game.call("/root/Main/Player", "get_position_y")
 
     # Jump
     await game.press_action("jump")
 
     # Wait for player to return to ground
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     final_y = await game.call("/root/Main/Player", "get_position_y")
     # Should be back at approximately same height
@@ -170,15 +166,12 @@ async def test_player_falls_after_jump(game):
 
 
 @pytest.mark.asyncio
-async def test_combined_jump_and_move(game):
+async def test_combined_jump_and_move(game, player_grounded):
     """Player can jump while moving.
 
     Demonstrates: Combining multiple inputs
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     initial_pos = await game.get_property("/root/Main/Player", "position")
 
@@ -193,15 +186,12 @@ async def test_combined_jump_and_move(game):
 
 
 @pytest.mark.asyncio
-async def test_velocity_reflects_movement(game):
+async def test_velocity_reflects_movement(game, player_grounded):
     """Velocity values reflect player movement.
 
     Demonstrates: Reading physics state via call()
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     # Check initial velocity (should be near zero)
     vx = await game.call("/root/Main/Player", "get_velocity_x")
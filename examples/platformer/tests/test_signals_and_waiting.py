@@ -18,47 +18,46 @@ import pytest
 
 
 @pytest.mark.asyncio
-async def test_wait_for_jumped_signal(game):
+async def test_wait_for_jumped_signal(game, player_grounded):
     """Wait for the player jumped signal.
 
     Demonstrates: wait_for_signal() with player signals
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
-    # Start waiting for signal before triggering it
-    # Note: We need to trigger jump in parallel with waiting
+    # Start waiting for the signal before triggering it so the
+    # emission can't be missed
+    jumped = asyncio.create_task(
+        game.wait_for_signal("jumped", source="/root/Main/Player", timeout=2.0)
+    )
+    await asyncio.sleep(0)  # let the waiter register before the press
 
     # Jump to trigger signal
     await game.press_action("jump")
 
-    # The signal should have been emitted
-    # We verify by checking player state
-    await asyncio.sleep(0.1)
+    # The waiter returns on the same physics tick as the jump
+    result = await jumped
+    assert result["signal"] == "jumped"
+
     is_jumping = await game.call("/root/Main/Player", "is_jumping")
     assert is_jumping, "Player should be jumping after jump action"
 
 
 @pytest.mark.asyncio
-async def test_wait_for_landed_signal(game):
+async def test_wait_for_landed_signal(game, player_grounded):
     """Wait for player to land after jumping.
 
     Demonstrates: Waiting for physics events via signals
     """
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
     # Ensure grounded first
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     # Jump
     await game.press_action("jump")
     await asyncio.sleep(0.1)
 
     # Wait for landing (player becomes grounded again)
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     grounded = await game.call("/root/Main/Player", "is_grounded")
     assert grounded, "Player should be grounded after landing"
@@ -72,14 +71,16 @@ async def test_wait_for_collection_event(game):
     """
     initial_coins = await game.call("/root/Main/Player", "get_coins")
 
-    # Move player to a coin position
+    # Move player to a coin position and read back the count after the
+    # next physics frame - a single round-trip instead of write + sleep + read
     # Coin1 is at (250, 410), player starts around (100, 500)
-    await game.call("/root/Main/Player", "set_position_for_test", [250.0, 380.0])
-
-    # Wait a moment for collision detection
-    await asyncio.sleep(0.3)
+    await game.batch_pipeline([
+        ("call", "/root/Main/Player", "set_position_for_test", [250.0, 380.0]),
+        ("await_frame",),
+        ("call", "/root/Main/Player", "get_coins"),
+    ])
 
-    # Check if coin was collected
+    # Check if coin was collected (collision may take a few more frames)
     async def has_more_coins():
         coins = await game.call("/root/Main/Player", "get_coins")
         return coins > initial_coins
@@ -228,7 +229,7 @@ async def test_wait_for_score_change(game):
 
 
 @pytest.mark.asyncio
-async def test_wait_for_player_state(game):
+async def test_wait_for_player_state(game, player_grounded):
     """Wait for player to reach specific state.
 
     Demonstrates: State machine testing
@@ -238,11 +239,8 @@ async def test_wait_for_player_state(game):
         state = await game.call("/root/Main/Player", "get_state")
         return state == "idle"
 
-    async def is_grounded():
-        return await game.call("/root/Main/Player", "is_grounded")
-
     # First ensure grounded
-    await game.wait_for(is_grounded, timeout=3.0)
+    await game.wait_for(player_grounded, timeout=3.0)
 
     # Stop any movement and wait for idle
     await asyncio.sleep(0.3)
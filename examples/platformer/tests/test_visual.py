@@ -54,14 +54,10 @@ async def test_save_screenshot(game, tmp_path):
 async def test_screenshot_after_movement(game):
     """Take screenshot after player movement.
 
-    Demonstrates: Screenshot timing with game state
+    Demonstrates: act_and_screenshot() - move, settle and capture in
+    one round-trip
     """
-    # Move player
-    await game.hold_action("move_right", duration=0.3)
-    await asyncio.sleep(0.1)
-
-    # Screenshot should capture new position
-    png_data = await game.screenshot()
+    png_data = await game.act_and_screenshot("move_right", duration=0.3)
     assert png_data is not None
     assert len(png_data) > 1000, "Screenshot should have significant content"
 
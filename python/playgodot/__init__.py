@@ -3,6 +3,8 @@
 Uses Godot's native RemoteDebugger protocol for automation.
 """
 
+from typing import TYPE_CHECKING
+
 from playgodot.exceptions import (
     CommandError,
     ConnectionError,
@@ -10,9 +12,11 @@ from playgodot.exceptions import (
     PlayGodotError,
     TimeoutError,
 )
-from playgodot.godot import Godot
-from playgodot.native_client import NativeClient
-from playgodot.node import Node
+
+if TYPE_CHECKING:
+    from playgodot.godot import Godot
+    from playgodot.native_client import NativeClient
+    from playgodot.node import Node
 
 __version__ = "0.6.0"
 __all__ = [
@@ -25,3 +29,22 @@ __all__ = [
     "NodeNotFoundError",
     "CommandError",
 ]
+
+# The heavyweight classes load lazily (PEP 562) so that
+# `import playgodot` doesn't pay for subprocess/socket machinery the
+# caller may never touch. Exceptions stay eager: they are tiny and
+# every submodule imports them anyway.
+_LAZY_IMPORTS = {
+    "Godot": "playgodot.godot",
+    "NativeClient": "playgodot.native_client",
+    "Node": "playgodot.node",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    return getattr(importlib.import_module(module_name), name)
@@ -13,7 +13,9 @@ without requiring any addon to be installed in the game.
 from __future__ import annotations
 
 import asyncio
+import socket
 import struct
+import time
 from typing import Any
 
 from playgodot.exceptions import ConnectionError, TimeoutError
@@ -40,10 +42,14 @@ class NativeClient:
         self._writer: asyncio.StreamWriter | None = None
         self._server: asyncio.Server | None = None
         self._pending: dict[str, asyncio.Future[Any]] = {}
+        # Responses to send_nowait commands, counted per response name so
+        # the receive loop can discard them instead of letting a stale
+        # ack resolve a later same-named request.
+        self._discard_counts: dict[str, int] = {}
         self._receive_task: asyncio.Task[None] | None = None
-        self._request_id = 0
         self._connected_event: asyncio.Event | None = None
         self._godot_thread_id: int = 0  # Will be set from first received message
+        self._thread_id_event: asyncio.Event = asyncio.Event()
 
     @property
     def is_connected(self) -> bool:
@@ -90,7 +96,7 @@ class NativeClient:
         if self._connected_event is None:
             self._connected_event = asyncio.Event()
 
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.monotonic()
         try:
             await asyncio.wait_for(
                 self._connected_event.wait(),
@@ -101,11 +107,14 @@ class NativeClient:
                 f"Godot did not connect to {self.host}:{self.port} within {timeout}s"
             )
 
-        # Wait for Godot's thread ID to be captured from first message
-        remaining = timeout - (asyncio.get_event_loop().time() - start_time)
-        while self._godot_thread_id == 0 and remaining > 0:
-            await asyncio.sleep(0.1)
-            remaining = timeout - (asyncio.get_event_loop().time() - start_time)
+        # Wait for Godot's thread ID, set by the receive loop on the
+        # first message — event-driven, so readiness costs no poll lag.
+        remaining = timeout - (time.monotonic() - start_time)
+        if self._godot_thread_id == 0 and remaining > 0:
+            try:
+                await asyncio.wait_for(self._thread_id_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
 
         if self._godot_thread_id == 0:
             print("[NativeClient] Warning: Godot thread ID not captured yet")
@@ -117,6 +126,7 @@ class NativeClient:
     ) -> None:
         """Handle incoming connection from Godot."""
         print("[NativeClient] Godot connected")
+        self._set_tcp_nodelay(writer)
         self._reader = reader
         self._writer = writer
         self._receive_task = asyncio.create_task(self._receive_loop())
@@ -124,6 +134,23 @@ class NativeClient:
         if self._connected_event:
             self._connected_event.set()
 
+    @staticmethod
+    def _set_tcp_nodelay(writer: asyncio.StreamWriter) -> None:
+        """Disable Nagle's algorithm on the accepted socket.
+
+        Automation commands are small frames exchanged ping-pong style;
+        letting the kernel coalesce them can park each one for up to a
+        delayed-ACK interval, which dominates per-command latency. The
+        few extra small packets are a fine trade.
+        """
+        sock = writer.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass  # Not a TCP socket, or platform doesn't support the option
+
     async def disconnect(self) -> None:
         """Disconnect from Godot and stop the server."""
         if self._receive_task:
@@ -153,6 +180,7 @@ class NativeClient:
             if not future.done():
                 future.cancel()
         self._pending.clear()
+        self._discard_counts.clear()
 
     async def send(
         self,
@@ -184,12 +212,8 @@ class NativeClient:
         # Map method + params to automation protocol data array
         data = self._params_to_data(method, params or {})
 
-        # Generate unique key for this request
-        self._request_id += 1
-        request_key = f"automation:{method}_{self._request_id}"
-
         # Create future for response
-        future: asyncio.Future[Any] = asyncio.get_event_loop().create_future()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
         expected_response = self._get_expected_response(method)
         self._pending[expected_response] = future
 
@@ -210,10 +234,107 @@ class NativeClient:
         finally:
             self._pending.pop(expected_response, None)
 
+    async def send_nowait(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Send an automation command without waiting for the response.
+
+        Fire-and-forget variant of `send` for state-mutating commands
+        whose reply is unused (e.g. restoring time scale at the end of a
+        test). The command goes over the same socket and Godot's
+        single-threaded main loop dispatches in arrival order, so
+        ordering relative to surrounding `send` calls is preserved. The
+        transport correlates responses by message name, so the eventual
+        reply is counted for discard up front: the receive loop consumes
+        it instead of letting it resolve a later same-named `send`.
+        Avoid this for commands whose response payload matters.
+
+        Args:
+            method: The RPC method name.
+            params: Optional parameters (will be converted to array).
+
+        Raises:
+            ConnectionError: If not connected.
+        """
+        if not self._writer or not self._reader:
+            raise ConnectionError("Not connected to Godot")
+
+        data = self._params_to_data(method, params or {})
+        message = encode_message(f"automation:{method}", self._godot_thread_id, data)
+        # Count the discard before writing: the response could arrive
+        # while this coroutine is suspended in drain().
+        expected_response = self._get_expected_response(method)
+        self._discard_counts[expected_response] = self._discard_counts.get(expected_response, 0) + 1
+        print(f"[NativeClient] Sending (nowait): automation:{method} with data: {data}")
+        self._writer.write(message)
+        await self._writer.drain()
+
+    async def send_batch(
+        self,
+        requests: list[tuple[str, dict[str, Any]]],
+        timeout: float = 30.0,
+    ) -> list[Any]:
+        """Send several node commands in one batch round-trip.
+
+        The native transport correlates responses by message name, so
+        commands cannot simply be issued concurrently; instead the
+        automation `batch` command carries many node operations in one
+        frame and returns their results together, collapsing N
+        round-trips into one on latency-bound call sequences.
+
+        Args:
+            requests: (method, params) pairs; each method must be one of
+                "call_method", "get_property" or "set_property".
+            timeout: Request timeout in seconds.
+
+        Returns:
+            List of results in request order.
+
+        Raises:
+            ValueError: If a method cannot be carried in a batch.
+            ConnectionError: If not connected.
+            TimeoutError: If the batch times out.
+        """
+        ops: list[dict[str, Any]] = []
+        for method, params in requests:
+            if method == "call_method":
+                ops.append({
+                    "op": "call",
+                    "path": params.get("path", ""),
+                    "method": params.get("method", ""),
+                    "args": params.get("args", []),
+                })
+            elif method == "get_property":
+                ops.append({
+                    "op": "get",
+                    "path": params.get("path", ""),
+                    "property": params.get("property", ""),
+                })
+            elif method == "set_property":
+                ops.append({
+                    "op": "set",
+                    "path": params.get("path", ""),
+                    "property": params.get("property", ""),
+                    "value": params.get("value"),
+                })
+            else:
+                raise ValueError(f"Command not batchable: {method!r}")
+
+        result = await self.send("batch", {"ops": ops}, timeout=timeout)
+        return result.get("results", [])
+
     def _params_to_data(self, method: str, params: dict[str, Any]) -> list:
         """Convert JSON-RPC style params to automation protocol data array."""
         if method == "get_tree":
-            return []
+            # Optional depth bound: [] means full tree
+            depth = params.get("depth")
+            return [depth] if depth is not None else []
+        elif method == "query_children":
+            return [params.get("path", ""), params.get("depth", 1)]
+        elif method == "count_children":
+            return [params.get("path", "")]
         elif method == "get_node":
             return [params.get("path", "")]
         elif method == "get_property":
@@ -230,6 +351,9 @@ class NativeClient:
                 params.get("method", ""),
                 params.get("args", []),
             ]
+        elif method == "batch":
+            # batch: [ops_array] - each op is a dict describing call/get/set
+            return [params.get("ops", [])]
         elif method == "node_exists":
             # Use get_node and check if result is null
             return [params.get("path", "")]
@@ -273,6 +397,9 @@ class NativeClient:
                 params.get("pressed", True),
                 params.get("strength", 1.0),
             ]
+        elif method == "input_sequence":
+            # input_sequence: [steps_array] - steps run server-timed
+            return [params.get("steps", [])]
         # Extended automation commands (Phase 3)
         elif method == "screenshot":
             return [params.get("node_path", "")]
@@ -296,6 +423,11 @@ class NativeClient:
                 params.get("source", ""),
                 params.get("timeout", 30000),
             ]
+        elif method == "wait_node":
+            return [
+                params.get("path", ""),
+                params.get("timeout", 30000),
+            ]
         else:
             # For unknown methods, just pass params as list
             return list(params.values()) if params else []
@@ -309,21 +441,26 @@ class NativeClient:
             "get_property": "automation:property",
             "set_property": "automation:set_result",
             "call_method": "automation:call_result",
+            "batch": "automation:batch_result",
             "mouse_button": "automation:input_result",
             "mouse_motion": "automation:input_result",
             "key": "automation:input_result",
             "touch": "automation:input_result",
             "action": "automation:input_result",
+            "input_sequence": "automation:sequence_result",
             # Extended automation (Phase 3)
             "screenshot": "automation:screenshot",
             "query_nodes": "automation:query_result",
             "count_nodes": "automation:count_result",
+            "query_children": "automation:children_result",
+            "count_children": "automation:child_count",
             "get_current_scene": "automation:current_scene",
             "change_scene": "automation:scene_changed",
             "reload_scene": "automation:scene_reloaded",
             "pause": "automation:pause_result",
             "time_scale": "automation:time_scale_result",
             "wait_signal": "automation:wait_signal_result",
+            "wait_node": "automation:wait_node_result",
         }
         return response_map.get(method, f"automation:{method}")
 
@@ -351,9 +488,15 @@ class NativeClient:
             if len(data) >= 3:
                 return {"value": data[2]}
             return {"value": None}
+        elif method == "batch":
+            # Response is [results_array] - one result per batched op
+            return {"results": data[0]} if data else {"results": []}
         elif method in ("mouse_button", "mouse_motion", "key", "touch", "action"):
             # Response is [success]
             return {"success": bool(data[0])} if data else {"success": False}
+        elif method == "input_sequence":
+            # Response is [png_bytes_or_null] from a trailing screenshot step
+            return {"data": data[0]} if data else {"data": None}
         # Extended automation (Phase 3)
         elif method == "screenshot":
             # Response is [png_bytes] - raw PNG data as PackedByteArray
@@ -366,6 +509,12 @@ class NativeClient:
         elif method == "count_nodes":
             # Response is [count]
             return data[0] if data else 0
+        elif method == "query_children":
+            # Response is [array_of_node_paths]
+            return data[0] if data else []
+        elif method == "count_children":
+            # Response is [count]
+            return data[0] if data else 0
         elif method == "get_current_scene":
             # Response is [scene_path, scene_name]
             if len(data) >= 2:
@@ -385,6 +534,9 @@ class NativeClient:
             if len(data) >= 2:
                 return {"signal": data[0], "args": data[1]}
             return {"signal": "", "args": []}
+        elif method == "wait_node":
+            # Response is [node_dict or null]
+            return {"node": data[0]} if data else {"node": None}
         else:
             return data
 
@@ -409,6 +561,7 @@ class NativeClient:
                     # Capture the Godot main thread ID from the first message
                     if self._godot_thread_id == 0 and thread_id != 0:
                         self._godot_thread_id = thread_id
+                        self._thread_id_event.set()
                         print(f"[NativeClient] Captured Godot thread ID: {thread_id}")
 
                     await self._handle_response(name, data)
@@ -420,15 +573,39 @@ class NativeClient:
 
         except asyncio.IncompleteReadError:
             # Connection closed
-            pass
+            self._fail_pending(ConnectionError("Godot closed the connection"))
         except asyncio.CancelledError:
             pass
         except Exception as e:
             print(f"[NativeClient] Receive loop error: {e}")
+            self._fail_pending(ConnectionError(f"Receive loop error: {e}"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail all in-flight requests immediately.
+
+        Once the receive loop has stopped, no response can arrive;
+        without this, each pending request would hang until its own
+        timeout expired.
+        """
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self._pending.clear()
+        self._discard_counts.clear()
 
     async def _handle_response(self, name: str, data: list) -> None:
         """Handle a response message from Godot."""
         print(f"[NativeClient] Received message: {name} with data length: {len(data)}")
+        # Responses owed to send_nowait are discarded before matching,
+        # so a stale ack never resolves a later same-named request.
+        remaining = self._discard_counts.get(name, 0)
+        if remaining:
+            if remaining > 1:
+                self._discard_counts[name] = remaining - 1
+            else:
+                del self._discard_counts[name]
+            print(f"[NativeClient] Discarding response for nowait request: {name}")
+            return
         # Find matching pending request
         future = self._pending.get(name)
         if future and not future.done():
@@ -174,6 +174,28 @@ class NativeInputSimulator:
             "x": x, "y": y, "rel_x": 0, "rel_y": 0
         })
 
+    async def _run_sequence(self, steps: list[dict], duration: float, wait: bool) -> None:
+        """Dispatch a server-timed input_sequence.
+
+        With wait=True the call returns once Godot has executed the
+        last step; with wait=False the sequence is queued
+        fire-and-forget so the caller can pipeline further commands.
+        """
+        if wait:
+            await self._client.send(
+                "input_sequence", {"steps": steps}, timeout=duration + 30.0
+            )
+        else:
+            await self._client.send_nowait("input_sequence", {"steps": steps})
+
+    async def flush(self, timeout: float = 30.0) -> None:
+        """Wait until all previously queued no-wait input has run.
+
+        Sequences execute in dispatch order, so awaiting an empty
+        sequence resynchronizes after any number of wait=False sends.
+        """
+        await self._client.send("input_sequence", {"steps": []}, timeout=timeout)
+
     async def drag(
         self,
         from_x: float,
@@ -181,30 +203,33 @@ class NativeInputSimulator:
         to_x: float,
         to_y: float,
         duration: float = 0.5,
+        wait: bool = True,
     ) -> None:
-        """Simulate a drag operation."""
-        # Press at start
-        await self._client.send("mouse_button", {
-            "x": from_x, "y": from_y, "button": 1, "pressed": True
-        })
+        """Simulate a drag operation.
 
-        # Move in steps
+        The press, sampled motion path and release go over as one
+        server-timed input_sequence, so the whole gesture costs a
+        single round-trip and its pacing follows the engine clock.
+        """
         steps = max(int(duration * 60), 10)  # ~60fps
+        step_ms = int(duration * 1000 / steps)
+        sequence: list[dict] = [
+            {"type": "mouse_button", "x": from_x, "y": from_y, "button": 1, "pressed": True}
+        ]
         for i in range(1, steps + 1):
             t = i / steps
-            x = from_x + (to_x - from_x) * t
-            y = from_y + (to_y - from_y) * t
-            await self._client.send("mouse_motion", {
-                "x": x, "y": y,
+            sequence.append({
+                "type": "mouse_motion",
+                "x": from_x + (to_x - from_x) * t,
+                "y": from_y + (to_y - from_y) * t,
                 "rel_x": (to_x - from_x) / steps,
-                "rel_y": (to_y - from_y) / steps
+                "rel_y": (to_y - from_y) / steps,
             })
-            await asyncio.sleep(duration / steps)
-
-        # Release at end
-        await self._client.send("mouse_button", {
-            "x": to_x, "y": to_y, "button": 1, "pressed": False
-        })
+            sequence.append({"type": "wait_ms", "ms": step_ms})
+        sequence.append(
+            {"type": "mouse_button", "x": to_x, "y": to_y, "button": 1, "pressed": False}
+        )
+        await self._run_sequence(sequence, duration, wait)
 
     async def drag_node(self, from_path: str, to_path: str, duration: float = 0.5) -> None:
         """Simulate dragging from one node to another."""
@@ -238,24 +263,38 @@ class NativeInputSimulator:
                         "keycode": keycode, "pressed": False
                     })
 
-    async def type_text(self, text: str, delay: float = 0.05) -> None:
-        """Type a string of text."""
+    async def type_text(self, text: str, delay: float = 0.05, wait: bool = True) -> None:
+        """Type a string of text.
+
+        The whole string goes over as one server-timed input_sequence:
+        Godot spaces the keystrokes by `delay` against the engine clock,
+        so typing costs a single round-trip instead of 3-4 per
+        character. With wait=False the call returns as soon as the
+        sequence is queued, overlapping typing with whatever the caller
+        does next.
+        """
+        steps: list[dict] = []
+        half_ms = int(delay * 1000 / 2)
         for char in text:
             keycode = ord(char.upper()) if char.isalpha() else ord(char)
             # For uppercase, hold shift
             needs_shift = char.isupper()
             if needs_shift:
-                await self._client.send("key", {
-                    "keycode": KEY_CODES["shift"], "pressed": True
-                })
-            await self._client.send("key", {"keycode": keycode, "pressed": True})
-            await asyncio.sleep(delay / 2)
-            await self._client.send("key", {"keycode": keycode, "pressed": False})
+                steps.append(
+                    {"type": "key", "keycode": KEY_CODES["shift"], "pressed": True}
+                )
+            steps.append({"type": "key", "keycode": keycode, "pressed": True})
+            steps.append({"type": "wait_ms", "ms": half_ms})
+            steps.append({"type": "key", "keycode": keycode, "pressed": False})
             if needs_shift:
-                await self._client.send("key", {
-                    "keycode": KEY_CODES["shift"], "pressed": False
-                })
-            await asyncio.sleep(delay / 2)
+                steps.append(
+                    {"type": "key", "keycode": KEY_CODES["shift"], "pressed": False}
+                )
+            steps.append({"type": "wait_ms", "ms": half_ms})
+
+        if not steps:
+            return
+        await self._run_sequence(steps, len(text) * delay, wait)
 
     async def press_action(self, action: str) -> None:
         """Press an input action."""
@@ -263,11 +302,14 @@ class NativeInputSimulator:
         await asyncio.sleep(0.02)
         await self._client.send("action", {"action": action, "pressed": False})
 
-    async def hold_action(self, action: str, duration: float) -> None:
-        """Hold an input action for a duration."""
-        await self._client.send("action", {"action": action, "pressed": True})
-        await asyncio.sleep(duration)
-        await self._client.send("action", {"action": action, "pressed": False})
+    async def hold_action(self, action: str, duration: float, wait: bool = True) -> None:
+        """Hold an input action for a duration (server-timed)."""
+        sequence = [
+            {"type": "action", "action": action, "pressed": True},
+            {"type": "wait_ms", "ms": int(duration * 1000)},
+            {"type": "action", "action": action, "pressed": False},
+        ]
+        await self._run_sequence(sequence, duration, wait)
 
     async def release_action(self, action: str) -> None:
         """Release an input action."""
@@ -286,30 +328,30 @@ class NativeInputSimulator:
         to_x: float,
         to_y: float,
         duration: float = 0.3,
+        wait: bool = True,
     ) -> None:
-        """Simulate a swipe gesture."""
-        # Touch down
-        await self._client.send("touch", {
-            "index": 0, "x": from_x, "y": from_y, "pressed": True
-        })
-
-        # Move in steps (using drag events for touch movement isn't directly supported,
-        # but we can simulate with multiple touch events)
+        """Simulate a swipe gesture (server-timed, one round-trip)."""
         steps = max(int(duration * 60), 10)
+        step_ms = int(duration * 1000 / steps)
+        sequence: list[dict] = [
+            {"type": "touch", "index": 0, "x": from_x, "y": from_y, "pressed": True}
+        ]
+        # Touch movement isn't a separate event type; keep the touch
+        # pressed at each sampled position along the path.
         for i in range(1, steps + 1):
             t = i / steps
-            x = from_x + (to_x - from_x) * t
-            y = from_y + (to_y - from_y) * t
-            # Keep touch pressed while moving
-            await self._client.send("touch", {
-                "index": 0, "x": x, "y": y, "pressed": True
+            sequence.append({
+                "type": "touch",
+                "index": 0,
+                "x": from_x + (to_x - from_x) * t,
+                "y": from_y + (to_y - from_y) * t,
+                "pressed": True,
             })
-            await asyncio.sleep(duration / steps)
-
-        # Touch up
-        await self._client.send("touch", {
-            "index": 0, "x": to_x, "y": to_y, "pressed": False
-        })
+            sequence.append({"type": "wait_ms", "ms": step_ms})
+        sequence.append(
+            {"type": "touch", "index": 0, "x": to_x, "y": to_y, "pressed": False}
+        )
+        await self._run_sequence(sequence, duration, wait)
 
     async def pinch(
         self,
@@ -317,8 +359,9 @@ class NativeInputSimulator:
         center_y: float,
         scale: float,
         duration: float = 0.3,
+        wait: bool = True,
     ) -> None:
-        """Simulate a pinch gesture.
+        """Simulate a pinch gesture (server-timed, one round-trip).
 
         Uses two touch points moving toward or away from center.
         """
@@ -327,49 +370,27 @@ class NativeInputSimulator:
         final_dist = initial_dist * scale
 
         steps = max(int(duration * 60), 10)
+        step_ms = int(duration * 1000 / steps)
 
-        # Start both touch points
-        await self._client.send("touch", {
-            "index": 0,
-            "x": center_x - initial_dist,
-            "y": center_y,
-            "pressed": True
-        })
-        await self._client.send("touch", {
-            "index": 1,
-            "x": center_x + initial_dist,
-            "y": center_y,
-            "pressed": True
-        })
+        def touch(index: int, x: float, pressed: bool) -> dict:
+            return {
+                "type": "touch",
+                "index": index,
+                "x": x,
+                "y": center_y,
+                "pressed": pressed,
+            }
 
-        # Move fingers
+        sequence = [
+            touch(0, center_x - initial_dist, True),
+            touch(1, center_x + initial_dist, True),
+        ]
         for i in range(1, steps + 1):
             t = i / steps
             dist = initial_dist + (final_dist - initial_dist) * t
-            await self._client.send("touch", {
-                "index": 0,
-                "x": center_x - dist,
-                "y": center_y,
-                "pressed": True
-            })
-            await self._client.send("touch", {
-                "index": 1,
-                "x": center_x + dist,
-                "y": center_y,
-                "pressed": True
-            })
-            await asyncio.sleep(duration / steps)
-
-        # Release both
-        await self._client.send("touch", {
-            "index": 0,
-            "x": center_x - final_dist,
-            "y": center_y,
-            "pressed": False
-        })
-        await self._client.send("touch", {
-            "index": 1,
-            "x": center_x + final_dist,
-            "y": center_y,
-            "pressed": False
-        })
+            sequence.append(touch(0, center_x - dist, True))
+            sequence.append(touch(1, center_x + dist, True))
+            sequence.append({"type": "wait_ms", "ms": step_ms})
+        sequence.append(touch(0, center_x - final_dist, False))
+        sequence.append(touch(1, center_x + final_dist, False))
+        await self._run_sequence(sequence, duration, wait)
@@ -70,6 +70,15 @@ class VariantType(IntEnum):
 # Header flags from marshalls.cpp
 HEADER_DATA_FLAG_64 = 1 << 16
 
+# Precompiled structs for the hot encode/decode paths. Every RPC runs
+# through these, and precompiling skips the per-call format parse and
+# format-cache lookup inside the struct module.
+_U32 = struct.Struct("<I")
+_U32_PAIR = struct.Struct("<II")
+_HDR_I32 = struct.Struct("<Ii")
+_HDR_I64 = struct.Struct("<Iq")
+_HDR_F64 = struct.Struct("<Id")
+
 
 class VariantEncoder:
     """Encodes Python values to Godot Variant binary format."""
@@ -105,20 +114,20 @@ class VariantEncoder:
 
     def _encode_nil(self) -> bytes:
         """NIL: just header, no payload."""
-        return struct.pack("<I", VariantType.NIL)
+        return _U32.pack(VariantType.NIL)
 
     def _encode_bool(self, value: bool) -> bytes:
         """BOOL: header + uint32 (0 or 1)."""
-        return struct.pack("<II", VariantType.BOOL, 1 if value else 0)
+        return _U32_PAIR.pack(VariantType.BOOL, 1 if value else 0)
 
     def _encode_int(self, value: int) -> bytes:
         """INT: header + int32 or int64 depending on range."""
         # From marshalls.cpp: use 64-bit if > INT_MAX or < INT_MIN
         if -2147483648 <= value <= 2147483647:
-            return struct.pack("<Ii", VariantType.INT, value)
+            return _HDR_I32.pack(VariantType.INT, value)
         else:
             header = VariantType.INT | HEADER_DATA_FLAG_64
-            return struct.pack("<Iq", header, value)
+            return _HDR_I64.pack(header, value)
 
     def _encode_float(self, value: float) -> bytes:
         """FLOAT: header + float32 or float64.
@@ -127,7 +136,7 @@ class VariantEncoder:
         We always use 64-bit to preserve precision.
         """
         header = VariantType.FLOAT | HEADER_DATA_FLAG_64
-        return struct.pack("<Id", header, value)
+        return _HDR_F64.pack(header, value)
 
     def _encode_string(self, value: str) -> bytes:
         """STRING: header + length + UTF-8 bytes + padding.
@@ -143,7 +152,7 @@ class VariantEncoder:
         pad_len = (4 - length % 4) % 4
         padded = utf8 + b"\x00" * pad_len
 
-        return struct.pack("<II", VariantType.STRING, length) + padded
+        return _U32_PAIR.pack(VariantType.STRING, length) + padded
 
     def _encode_array(self, value: list | tuple) -> bytes:
         """ARRAY: header + count + encoded elements.
@@ -152,7 +161,7 @@ class VariantEncoder:
         - encode_uint32(array.size(), buf)
         - for each element: encode_variant(elem, buf, ...)
         """
-        parts = [struct.pack("<II", VariantType.ARRAY, len(value))]
+        parts = [_U32_PAIR.pack(VariantType.ARRAY, len(value))]
         for item in value:
             parts.append(self.encode(item))
         return b"".join(parts)
@@ -164,7 +173,7 @@ class VariantEncoder:
         - encode_uint32(dict.size(), buf)
         - for each key, value: encode_variant(key), encode_variant(value)
         """
-        parts = [struct.pack("<II", VariantType.DICTIONARY, len(value))]
+        parts = [_U32_PAIR.pack(VariantType.DICTIONARY, len(value))]
         for k, v in value.items():
             parts.append(self.encode(k))
             parts.append(self.encode(v))
@@ -175,7 +184,7 @@ class VariantEncoder:
         length = len(value)
         pad_len = (4 - length % 4) % 4
         padded = value + b"\x00" * pad_len
-        return struct.pack("<II", VariantType.PACKED_BYTE_ARRAY, length) + padded
+        return _U32_PAIR.pack(VariantType.PACKED_BYTE_ARRAY, length) + padded
 
 
 class VariantDecoder:
@@ -194,7 +203,7 @@ class VariantDecoder:
         if len(data) - offset < 4:
             raise ValueError("Buffer too short for variant header")
 
-        header = struct.unpack_from("<I", data, offset)[0]
+        header = _U32.unpack_from(data, offset)[0]
         variant_type = header & 0xFF
         is_64bit = bool(header & HEADER_DATA_FLAG_64)
 
@@ -205,7 +214,7 @@ class VariantDecoder:
             return None, consumed
 
         elif variant_type == VariantType.BOOL:
-            val = struct.unpack_from("<I", data, payload_offset)[0]
+            val = _U32.unpack_from(data, payload_offset)[0]
             return bool(val), consumed + 4
 
         elif variant_type == VariantType.INT:
@@ -276,7 +285,7 @@ class VariantDecoder:
             return val, consumed + bytes_read
 
         elif variant_type == VariantType.PACKED_BYTE_ARRAY:
-            length = struct.unpack_from("<I", data, payload_offset)[0]
+            length = _U32.unpack_from(data, payload_offset)[0]
             payload_offset += 4
             val = data[payload_offset:payload_offset + length]
             # Account for padding
@@ -284,39 +293,31 @@ class VariantDecoder:
             return val, consumed + 4 + padded_len
 
         elif variant_type == VariantType.PACKED_INT32_ARRAY:
-            length = struct.unpack_from("<I", data, payload_offset)[0]
+            length = _U32.unpack_from(data, payload_offset)[0]
             payload_offset += 4
-            result = []
-            for i in range(length):
-                result.append(struct.unpack_from("<i", data, payload_offset + i * 4)[0])
+            result = list(struct.unpack_from(f"<{length}i", data, payload_offset))
             return result, consumed + 4 + length * 4
 
         elif variant_type == VariantType.PACKED_INT64_ARRAY:
-            length = struct.unpack_from("<I", data, payload_offset)[0]
+            length = _U32.unpack_from(data, payload_offset)[0]
             payload_offset += 4
-            result = []
-            for i in range(length):
-                result.append(struct.unpack_from("<q", data, payload_offset + i * 8)[0])
+            result = list(struct.unpack_from(f"<{length}q", data, payload_offset))
             return result, consumed + 4 + length * 8
 
         elif variant_type == VariantType.PACKED_FLOAT32_ARRAY:
-            length = struct.unpack_from("<I", data, payload_offset)[0]
+            length = _U32.unpack_from(data, payload_offset)[0]
             payload_offset += 4
-            result = []
-            for i in range(length):
-                result.append(struct.unpack_from("<f", data, payload_offset + i * 4)[0])
+            result = list(struct.unpack_from(f"<{length}f", data, payload_offset))
             return result, consumed + 4 + length * 4
 
         elif variant_type == VariantType.PACKED_FLOAT64_ARRAY:
-            length = struct.unpack_from("<I", data, payload_offset)[0]
+            length = _U32.unpack_from(data, payload_offset)[0]
             payload_offset += 4
-            result = []
-            for i in range(length):
-                result.append(struct.unpack_from("<d", data, payload_offset + i * 8)[0])
+            result = list(struct.unpack_from(f"<{length}d", data, payload_offset))
             return result, consumed + 4 + length * 8
 
         elif variant_type == VariantType.PACKED_STRING_ARRAY:
-            length = struct.unpack_from("<I", data, payload_offset)[0]
+            length = _U32.unpack_from(data, payload_offset)[0]
             current = payload_offset + 4
             total_consumed = 4
             result = []
@@ -342,7 +343,7 @@ class VariantDecoder:
 
     def _decode_string(self, data: bytes, offset: int) -> tuple[str, int]:
         """Decode string: length + UTF-8 bytes + padding."""
-        length = struct.unpack_from("<I", data, offset)[0]
+        length = _U32.unpack_from(data, offset)[0]
         offset += 4
         value = data[offset:offset + length].decode("utf-8")
         # Account for padding
@@ -358,15 +359,15 @@ class VariantDecoder:
         - Third uint32: flags (bit 0 = absolute)
         - Then: strings for names and subnames
         """
-        first = struct.unpack_from("<I", data, offset)[0]
+        first = _U32.unpack_from(data, offset)[0]
 
         if not (first & 0x80000000):
             # Old format not supported
             raise ValueError("Old NODE_PATH format not supported")
 
         namecount = first & 0x7FFFFFFF
-        subnamecount = struct.unpack_from("<I", data, offset + 4)[0]
-        flags = struct.unpack_from("<I", data, offset + 8)[0]
+        subnamecount = _U32.unpack_from(data, offset + 4)[0]
+        flags = _U32.unpack_from(data, offset + 8)[0]
 
         current = offset + 12
         consumed = 12
@@ -405,17 +406,17 @@ class VariantDecoder:
 
         if is_typed_array:
             # Typed array: [type_info][count][elements]
-            type_info = struct.unpack_from("<I", data, current)[0]
+            type_info = _U32.unpack_from(data, current)[0]
             current += 4
             consumed += 4
 
-            count = struct.unpack_from("<I", data, current)[0]
+            count = _U32.unpack_from(data, current)[0]
             current += 4
             consumed += 4
         else:
             # Untyped array: [count][elements]
             # Count may have flags in high bits
-            raw_count = struct.unpack_from("<I", data, offset)[0]
+            raw_count = _U32.unpack_from(data, offset)[0]
             count = raw_count & 0x7FFFFFFF  # Clear potential shared flag
             current = offset + 4
             consumed = 4
@@ -431,7 +432,7 @@ class VariantDecoder:
 
     def _decode_dictionary(self, data: bytes, offset: int) -> tuple[dict, int]:
         """Decode dictionary: count + key/value pairs."""
-        count = struct.unpack_from("<I", data, offset)[0]
+        count = _U32.unpack_from(data, offset)[0]
         count &= 0x7FFFFFFF  # Clear potential shared flag
         current = offset + 4
         consumed = 4
@@ -469,6 +470,16 @@ def decode_variant(data: bytes, offset: int = 0) -> tuple[Any, int]:
     return _decoder.decode(data, offset)
 
 
+# Every outgoing message starts with the same bytes for a given
+# (name, thread_id): the 3-element array header, the encoded command
+# name and the encoded thread ID. Cache that prefix so repeated
+# commands skip the UTF-8 encode + padding of the constant parts and
+# only serialize the data array per call. The key space is the small,
+# fixed set of automation command names, but cap it defensively.
+_MESSAGE_PREFIX_CACHE: dict[tuple[str, int], bytes] = {}
+_MESSAGE_PREFIX_CACHE_MAX = 128
+
+
 def encode_message(name: str, thread_id: int, data: list) -> bytes:
     """Encode a debugger protocol message with size prefix.
 
@@ -483,10 +494,20 @@ def encode_message(name: str, thread_id: int, data: list) -> bytes:
     Returns:
         Encoded message with 4-byte size prefix
     """
-    message = [name, thread_id, data]
-    encoded = encode_variant(message)
+    key = (name, thread_id)
+    prefix = _MESSAGE_PREFIX_CACHE.get(key)
+    if prefix is None:
+        prefix = (
+            _U32_PAIR.pack(VariantType.ARRAY, 3)
+            + encode_variant(name)
+            + encode_variant(thread_id)
+        )
+        if len(_MESSAGE_PREFIX_CACHE) >= _MESSAGE_PREFIX_CACHE_MAX:
+            _MESSAGE_PREFIX_CACHE.clear()
+        _MESSAGE_PREFIX_CACHE[key] = prefix
+    encoded = prefix + encode_variant(data)
     # Prefix with 4-byte length (from remote_debugger_peer.cpp _write_out)
-    return struct.pack("<I", len(encoded)) + encoded
+    return _U32.pack(len(encoded)) + encoded
 
 
 def decode_message(data: bytes) -> tuple[str, int, list]:
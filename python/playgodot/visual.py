@@ -0,0 +1,164 @@
+"""Perceptual hashing helpers for visual comparisons.
+
+Implements a 64-bit pHash (32x32 grayscale -> 8x8 low-frequency DCT
+block -> median threshold) with a small memo cache, so reference images
+are decoded and transformed once per file rather than once per
+assertion. Two hashes compare with a 64-bit XOR and popcount instead of
+any per-pixel work.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Any
+
+# Decode + DCT dominates repeated comparisons, so hashes are memoized:
+# files key on (path, mtime_ns), raw bytes on a short blake2b digest.
+_HASH_CACHE_MAX = 256
+_hash_cache: dict[Any, int] = {}
+
+_dct_basis = None  # 32x32 DCT-II basis matrix, built on first use
+
+
+def _dct(pixels: Any) -> Any:
+    """2D DCT-II of a 32x32 float array via the cached basis matrix."""
+    import numpy as np
+
+    global _dct_basis
+    if _dct_basis is None:
+        n = 32
+        k = np.arange(n)
+        _dct_basis = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n))
+    return _dct_basis @ pixels @ _dct_basis.T
+
+
+def _phash_bytes(data: bytes) -> int:
+    """Compute the 64-bit pHash of encoded image bytes."""
+    import numpy as np
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(data)).convert("L").resize((32, 32), Image.LANCZOS)
+    pixels = np.asarray(img, dtype=np.float64)
+    low_freq = _dct(pixels)[:8, :8]
+    median = np.median(low_freq)
+
+    bits = 0
+    for value in low_freq.flat:
+        bits = (bits << 1) | (1 if value > median else 0)
+    return bits
+
+
+def phash(image: bytes | str | Path) -> int:
+    """Perceptual hash of an image, memoized across calls.
+
+    Args:
+        image: Path to an image file, or encoded image bytes.
+
+    Returns:
+        The hash as a 64-bit int.
+
+    Raises:
+        FileNotFoundError: If a path is given and doesn't exist.
+    """
+    key: Any
+    if isinstance(image, (str, Path)):
+        path = Path(image)
+        key = (str(path), path.stat().st_mtime_ns)
+        if key in _hash_cache:
+            return _hash_cache[key]
+        value = _phash_bytes(path.read_bytes())
+    else:
+        key = hashlib.blake2b(image, digest_size=8).digest()
+        if key in _hash_cache:
+            return _hash_cache[key]
+        value = _phash_bytes(image)
+
+    if len(_hash_cache) >= _HASH_CACHE_MAX:
+        _hash_cache.pop(next(iter(_hash_cache)))
+    _hash_cache[key] = value
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    """Hamming distance between two 64-bit hashes."""
+    # bin().count() rather than int.bit_count(): the package supports 3.9.
+    return bin(a ^ b).count("1")
+
+
+def similarity(a: int, b: int) -> float:
+    """Similarity in [0.0, 1.0] from the Hamming distance of two hashes."""
+    return 1.0 - hamming(a, b) / 64.0
+
+
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+
+class ReferenceIndex:
+    """Nearest-reference lookup over a directory of screenshots.
+
+    Hashes each reference image once (through the memoized `phash`) and
+    indexes the hashes in a BK-tree keyed on Hamming distance, so
+    finding the closest reference scales with the tree depth rather
+    than a linear scan over every file as the reference library grows.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        # BK-tree node: [hash, path, {distance_to_child: child_node}]
+        self._root: list[Any] | None = None
+
+    def _build(self) -> None:
+        self._root = None
+        for path in sorted(self.directory.iterdir()):
+            if path.suffix.lower() in _IMAGE_SUFFIXES:
+                self._insert(phash(path), path)
+
+    def _insert(self, image_hash: int, path: Path) -> None:
+        if self._root is None:
+            self._root = [image_hash, path, {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(image_hash, node[0])
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [image_hash, path, {}]
+                return
+            node = child
+
+    def nearest(self, image: bytes | str | Path) -> tuple[Path, int]:
+        """Find the reference image closest to the given image.
+
+        Args:
+            image: Path to an image file, or encoded image bytes.
+
+        Returns:
+            Tuple of (reference path, Hamming distance to it).
+
+        Raises:
+            LookupError: If the directory holds no reference images.
+        """
+        if self._root is None:
+            self._build()
+        if self._root is None:
+            raise LookupError(f"No reference images in {self.directory}")
+
+        query = phash(image)
+        best_path: Path = self._root[1]
+        best_distance = hamming(query, self._root[0])
+
+        # Standard BK-tree search: only descend edges whose distance
+        # could still contain a closer match
+        stack = [self._root]
+        while stack:
+            node_hash, path, children = stack.pop()
+            distance = hamming(query, node_hash)
+            if distance < best_distance:
+                best_path, best_distance = path, distance
+            for edge, child in children.items():
+                if abs(edge - distance) <= best_distance:
+                    stack.append(child)
+
+        return best_path, best_distance
@@ -9,6 +9,8 @@ def mock_client():
     """Create a mock NativeClient."""
     client = MagicMock()
     client.send = AsyncMock()
+    client.send_nowait = AsyncMock()
+    client.disconnect = AsyncMock()
     client.is_connected = True
     client._writer = MagicMock()
     client._reader = MagicMock()
@@ -4,7 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 
-from playgodot.godot import Godot
+from playgodot.godot import Godot, _adaptive_intervals
 from playgodot.node import Node
 from playgodot.exceptions import NodeNotFoundError, TimeoutError
 
@@ -29,6 +29,23 @@ class TestGodotInit:
 class TestFindGodot:
     """Tests for Godot executable discovery."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        from playgodot.godot import _locate_godot
+
+        _locate_godot.cache_clear()
+        yield
+        _locate_godot.cache_clear()
+
+    def test_find_godot_cached_across_calls(self) -> None:
+        with patch("shutil.which") as mock_which:
+            mock_which.side_effect = lambda name: f"/usr/bin/{name}" if name == "godot" else None
+            first = Godot._find_godot()
+            second = Godot._find_godot()
+            assert first == second == "/usr/bin/godot"
+            # Second call should be served from the cache
+            assert mock_which.call_count == 2
+
     def test_find_godot_fork_first(self) -> None:
         with patch("shutil.which") as mock_which:
             mock_which.side_effect = lambda name: f"/usr/bin/{name}" if name == "godot-fork" else None
@@ -58,13 +75,14 @@ class TestLaunchCommandBuilding:
         project_path = tmp_path / "project"
         project_path.mkdir()
 
-        with patch("subprocess.Popen") as mock_popen, \
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
              patch.object(Godot, "_find_godot", return_value="/usr/bin/godot"), \
              patch("playgodot.godot.NativeClient") as mock_client_class:
 
             mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
+            mock_process.returncode = None
+            mock_process.wait = AsyncMock(return_value=0)
+            mock_exec.return_value = mock_process
 
             mock_client = AsyncMock()
             mock_client._start_server = AsyncMock()
@@ -80,8 +98,8 @@ class TestLaunchCommandBuilding:
                 pass
 
             # Verify Popen was called with the scene parameter
-            mock_popen.assert_called_once()
-            cmd = mock_popen.call_args[0][0]
+            mock_exec.assert_called_once()
+            cmd = list(mock_exec.call_args[0])
             assert "--scene" in cmd
             scene_index = cmd.index("--scene")
             assert cmd[scene_index + 1] == "res://scenes/test.tscn"
@@ -92,13 +110,14 @@ class TestLaunchCommandBuilding:
         project_path = tmp_path / "project"
         project_path.mkdir()
 
-        with patch("subprocess.Popen") as mock_popen, \
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
              patch.object(Godot, "_find_godot", return_value="/usr/bin/godot"), \
              patch("playgodot.godot.NativeClient") as mock_client_class:
 
             mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
+            mock_process.returncode = None
+            mock_process.wait = AsyncMock(return_value=0)
+            mock_exec.return_value = mock_process
 
             mock_client = AsyncMock()
             mock_client._start_server = AsyncMock()
@@ -113,8 +132,8 @@ class TestLaunchCommandBuilding:
                 pass
 
             # Verify Popen was called without the scene parameter
-            mock_popen.assert_called_once()
-            cmd = mock_popen.call_args[0][0]
+            mock_exec.assert_called_once()
+            cmd = list(mock_exec.call_args[0])
             assert "--scene" not in cmd
 
     @pytest.mark.asyncio
@@ -123,13 +142,14 @@ class TestLaunchCommandBuilding:
         project_path = tmp_path / "project"
         project_path.mkdir()
 
-        with patch("subprocess.Popen") as mock_popen, \
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
              patch.object(Godot, "_find_godot", return_value="/usr/bin/godot"), \
              patch("playgodot.godot.NativeClient") as mock_client_class:
 
             mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
+            mock_process.returncode = None
+            mock_process.wait = AsyncMock(return_value=0)
+            mock_exec.return_value = mock_process
 
             mock_client = AsyncMock()
             mock_client._start_server = AsyncMock()
@@ -147,8 +167,8 @@ class TestLaunchCommandBuilding:
                 pass
 
             # Verify all expected arguments are present
-            mock_popen.assert_called_once()
-            cmd = mock_popen.call_args[0][0]
+            mock_exec.assert_called_once()
+            cmd = list(mock_exec.call_args[0])
             assert "--headless" in cmd
             assert "--verbose" in cmd
             assert "--resolution" in cmd
@@ -157,6 +177,37 @@ class TestLaunchCommandBuilding:
             scene_index = cmd.index("--scene")
             assert cmd[scene_index + 1] == "res://scenes/experiment.tscn"
 
+    @pytest.mark.asyncio
+    async def test_launch_fails_fast_when_godot_exits(self, tmp_path) -> None:
+        """A Godot crash before the handshake should not burn the timeout."""
+        import asyncio
+
+        from playgodot.exceptions import ConnectionError
+
+        project_path = tmp_path / "project"
+        project_path.mkdir()
+
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
+             patch.object(Godot, "_find_godot", return_value="/usr/bin/godot"), \
+             patch("playgodot.godot.NativeClient") as mock_client_class:
+
+            mock_process = MagicMock()
+            mock_process.returncode = 1
+            mock_process.wait = AsyncMock(return_value=1)
+            mock_exec.return_value = mock_process
+
+            async def never_connects(timeout=30.0):
+                await asyncio.sleep(30)
+
+            mock_client = AsyncMock()
+            mock_client._start_server = AsyncMock()
+            mock_client.connect = never_connects
+            mock_client_class.return_value = mock_client
+
+            with pytest.raises(ConnectionError, match="exited with code 1"):
+                async with Godot.launch(str(project_path)):
+                    pass
+
 
 class TestNodeInteraction:
     """Tests for node interaction methods."""
@@ -214,6 +265,109 @@ class TestNodeInteraction:
             {"path": "/root/Main", "method": "add", "args": [10, 5]},
         )
 
+    @pytest.mark.asyncio
+    async def test_batch_calls(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"results": [5, 2, 3]}
+        results = await mock_godot.batch([
+            ("call", "/root/Main", "get_total_coins"),
+            ("call", "/root/Main/Player", "get_coins", [True]),
+            ("call", "/root/Main", "get_remaining_coins"),
+        ])
+        assert results == [5, 2, 3]
+        mock_client.send.assert_called_with(
+            "batch",
+            {
+                "ops": [
+                    {"op": "call", "path": "/root/Main", "method": "get_total_coins", "args": []},
+                    {"op": "call", "path": "/root/Main/Player", "method": "get_coins",
+                     "args": [True]},
+                    {"op": "call", "path": "/root/Main", "method": "get_remaining_coins",
+                     "args": []},
+                ]
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_call_many(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"results": [0, "idle"]}
+        results = await mock_godot.call_many([
+            ("/root/Main", "get_score"),
+            ("/root/Main", "get_player_state", ["verbose"]),
+        ])
+        assert results == [0, "idle"]
+        mock_client.send.assert_called_with(
+            "batch",
+            {
+                "ops": [
+                    {"op": "call", "path": "/root/Main", "method": "get_score", "args": []},
+                    {"op": "call", "path": "/root/Main", "method": "get_player_state",
+                     "args": ["verbose"]},
+                ]
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_mixed_ops(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"results": [{"x": 1.0, "y": 2.0}, None]}
+        results = await mock_godot.batch([
+            ("get", "/root/Main/Player", "position"),
+            ("set", "/root/Main/Player", "visible", False),
+        ])
+        assert results[0] == {"x": 1.0, "y": 2.0}
+        mock_client.send.assert_called_with(
+            "batch",
+            {
+                "ops": [
+                    {"op": "get", "path": "/root/Main/Player", "property": "position"},
+                    {"op": "set", "path": "/root/Main/Player", "property": "visible",
+                     "value": False},
+                ]
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_pipeline_returns_final_result(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"results": [None, None, 3]}
+        result = await mock_godot.batch_pipeline([
+            ("call", "/root/Main/Player", "set_position_for_test", [250.0, 380.0]),
+            ("await_frame",),
+            ("call", "/root/Main/Player", "get_coins"),
+        ])
+        assert result == 3
+        mock_client.send.assert_called_with(
+            "batch",
+            {
+                "ops": [
+                    {"op": "call", "path": "/root/Main/Player",
+                     "method": "set_position_for_test", "args": [250.0, 380.0]},
+                    {"op": "await_frame"},
+                    {"op": "call", "path": "/root/Main/Player", "method": "get_coins",
+                     "args": []},
+                ]
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_pipeline_empty_results(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"results": []}
+        result = await mock_godot.batch_pipeline([("await_frame",)])
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_batch_unknown_op_raises(self, mock_godot) -> None:
+        with pytest.raises(ValueError) as exc:
+            await mock_godot.batch([("frobnicate", "/root/Main")])
+        assert "Unknown batch operation" in str(exc.value)
+
+    @pytest.mark.asyncio
+    async def test_call_nowait(self, mock_godot, mock_client) -> None:
+        await mock_godot.call_nowait("/root/Main", "reset", [True])
+        mock_client.send_nowait.assert_called_with(
+            "call_method",
+            {"path": "/root/Main", "method": "reset", "args": [True]},
+        )
+        mock_client.send.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_node_exists_true(self, mock_godot, mock_client) -> None:
         mock_client.send.return_value = {"path": "/root/Main"}
@@ -238,6 +392,117 @@ class TestNodeInteraction:
         result = await mock_godot.count_nodes("/root/Main/*")
         assert result == 5
 
+    @pytest.mark.asyncio
+    async def test_query_children(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = ["/root/Main/Coins/Coin1", "/root/Main/Coins/Coin2"]
+        result = await mock_godot.query_children("/root/Main/Coins")
+        assert result == ["/root/Main/Coins/Coin1", "/root/Main/Coins/Coin2"]
+        mock_client.send.assert_called_with(
+            "query_children",
+            {"path": "/root/Main/Coins", "depth": 1},
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_children_with_depth(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = []
+        await mock_godot.query_children("/root/Main", depth=2)
+        mock_client.send.assert_called_with(
+            "query_children",
+            {"path": "/root/Main", "depth": 2},
+        )
+
+    @pytest.mark.asyncio
+    async def test_count_children(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = 5
+        result = await mock_godot.count_children("/root/Main/Coins")
+        assert result == 5
+        mock_client.send.assert_called_with("count_children", {"path": "/root/Main/Coins"})
+
+
+class TestProbeCache:
+    """Tests for per-frame memoization of idempotent probes."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_getter_served_from_cache(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"value": 5}
+        with patch("playgodot.godot.time.monotonic", return_value=100.0):
+            first = await mock_godot.call("/root/Main", "get_total_coins")
+            second = await mock_godot.call("/root/Main", "get_total_coins")
+        assert first == second == 5
+        assert mock_client.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_property_served_from_cache(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"value": True}
+        with patch("playgodot.godot.time.monotonic", return_value=100.0):
+            await mock_godot.get_property("/root/Main/HUD", "visible")
+            await mock_godot.get_property("/root/Main/HUD", "visible")
+        assert mock_client.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_probe_expires_after_a_frame(self, mock_godot, mock_client) -> None:
+        # Real time advancing past one ~16ms frame must refresh the value
+        # even with no client-side mutation in between.
+        mock_client.send.return_value = {"value": 120.0}
+        with patch("playgodot.godot.time.monotonic", return_value=100.0):
+            first = await mock_godot.call("/root/Main/Player", "get_position_y")
+        mock_client.send.return_value = {"value": 96.0}
+        with patch("playgodot.godot.time.monotonic", return_value=100.1):
+            second = await mock_godot.call("/root/Main/Player", "get_position_y")
+        assert first == 120.0
+        assert second == 96.0
+        assert mock_client.send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_signal_invalidates_cache(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"value": False}
+        with patch("playgodot.godot.time.monotonic", return_value=100.0):
+            await mock_godot.call("/root/Main/Player", "is_grounded")
+            mock_client.send.return_value = {"signal": "landed", "args": []}
+            await mock_godot.wait_for_signal("landed")
+            mock_client.send.return_value = {"value": True}
+            result = await mock_godot.call("/root/Main/Player", "is_grounded")
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_set_property_invalidates_cache(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"value": 0}
+        await mock_godot.call("/root/Main", "get_score")
+        await mock_godot.set_property("/root/Main", "score", 100)
+        mock_client.send.return_value = {"value": 100}
+        result = await mock_godot.call("/root/Main", "get_score")
+        assert result == 100
+
+    @pytest.mark.asyncio
+    async def test_mutating_call_invalidates_cache(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"value": 3}
+        await mock_godot.call("/root/Main/Player", "get_coins")
+        await mock_godot.call("/root/Main/Player", "set_position_for_test", [250.0, 380.0])
+        mock_client.send.return_value = {"value": 4}
+        result = await mock_godot.call("/root/Main/Player", "get_coins")
+        assert result == 4
+
+    @pytest.mark.asyncio
+    async def test_input_invalidates_cache(self, mock_godot, mock_client) -> None:
+        mock_godot._input.press_action = AsyncMock()
+        mock_client.send.return_value = {"value": True}
+        await mock_godot.call("/root/Main/Player", "is_grounded")
+        await mock_godot.press_action("jump")
+        mock_client.send.return_value = {"value": False}
+        result = await mock_godot.call("/root/Main/Player", "is_grounded")
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_repolls_cached_probe(self, mock_godot, mock_client) -> None:
+        values = iter([{"value": False}, {"value": False}, {"value": True}])
+        mock_client.send.side_effect = lambda *a, **k: next(values)
+
+        async def is_grounded():
+            return await mock_godot.call("/root/Main/Player", "is_grounded")
+
+        result = await mock_godot.wait_for(is_grounded, timeout=2.0, interval=0.01)
+        assert result is True
+
 
 class TestInputMethods:
     """Tests for input simulation methods."""
@@ -254,6 +519,12 @@ class TestInputMethods:
         await mock_godot.click(100.0, 200.0)
         mock_godot._input.click.assert_called_with(100.0, 200.0)
 
+    @pytest.mark.asyncio
+    async def test_click_node_specialized(self, mock_godot) -> None:
+        mock_godot._input.click_node = AsyncMock()
+        await mock_godot.click_node("/root/Main/Button")
+        mock_godot._input.click_node.assert_called_with("/root/Main/Button")
+
     @pytest.mark.asyncio
     async def test_click_no_y_raises(self, mock_godot) -> None:
         with pytest.raises(ValueError) as exc:
@@ -300,7 +571,18 @@ class TestInputMethods:
     async def test_type_text(self, mock_godot) -> None:
         mock_godot._input.type_text = AsyncMock()
         await mock_godot.type_text("hello")
-        mock_godot._input.type_text.assert_called_with("hello")
+        mock_godot._input.type_text.assert_called_with("hello", wait=True)
+
+    @pytest.mark.asyncio
+    async def test_type_text_no_wait(self, mock_godot) -> None:
+        mock_godot._input.type_text = AsyncMock()
+        await mock_godot.type_text("hello", wait=False)
+        mock_godot._input.type_text.assert_called_with("hello", wait=False)
+
+    @pytest.mark.asyncio
+    async def test_flush_input_round_trips_empty_sequence(self, mock_godot, mock_client) -> None:
+        await mock_godot.flush_input()
+        mock_client.send.assert_called_with("input_sequence", {"steps": []}, timeout=30.0)
 
     @pytest.mark.asyncio
     async def test_press_action(self, mock_godot) -> None:
@@ -318,13 +600,13 @@ class TestInputMethods:
     async def test_swipe(self, mock_godot) -> None:
         mock_godot._input.swipe = AsyncMock()
         await mock_godot.swipe(0.0, 0.0, 100.0, 100.0)
-        mock_godot._input.swipe.assert_called_with(0.0, 0.0, 100.0, 100.0)
+        mock_godot._input.swipe.assert_called_with(0.0, 0.0, 100.0, 100.0, wait=True)
 
     @pytest.mark.asyncio
     async def test_pinch(self, mock_godot) -> None:
         mock_godot._input.pinch = AsyncMock()
         await mock_godot.pinch((100.0, 100.0), 0.5)
-        mock_godot._input.pinch.assert_called_with(100.0, 100.0, 0.5)
+        mock_godot._input.pinch.assert_called_with(100.0, 100.0, 0.5, wait=True)
 
 
 class TestSceneManagement:
@@ -361,6 +643,13 @@ class TestSceneManagement:
         mock_client.send.return_value = tree_data
         result = await mock_godot.get_tree()
         assert result == tree_data
+        mock_client.send.assert_called_with("get_tree", None)
+
+    @pytest.mark.asyncio
+    async def test_get_tree_with_depth(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"name": "root", "children": []}
+        await mock_godot.get_tree(depth=2)
+        mock_client.send.assert_called_with("get_tree", {"depth": 2})
 
 
 class TestGameState:
@@ -390,6 +679,18 @@ class TestGameState:
         await mock_godot.set_time_scale(2.0)
         mock_client.send.assert_called_with("time_scale", {"scale": 2.0})
 
+    @pytest.mark.asyncio
+    async def test_set_time_scale_nowait(self, mock_godot, mock_client) -> None:
+        await mock_godot.set_time_scale(1.0, wait=False)
+        mock_client.send_nowait.assert_called_with("time_scale", {"scale": 1.0})
+        mock_client.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unpause_nowait(self, mock_godot, mock_client) -> None:
+        await mock_godot.unpause(wait=False)
+        mock_client.send_nowait.assert_called_with("pause", {"paused": False})
+        mock_client.send.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_time_scale(self, mock_godot, mock_client) -> None:
         mock_client.send.return_value = {"scale": 1.5}
@@ -428,6 +729,138 @@ class TestScreenshot:
             await mock_godot.screenshot()
         assert "Failed to take screenshot" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_act_and_screenshot(self, mock_godot, mock_client) -> None:
+        png_data = b"\x89PNG\r\n\x1a\n..."
+        mock_client.send.return_value = {"data": png_data}
+
+        result = await mock_godot.act_and_screenshot("move_right", duration=0.3)
+
+        assert result == png_data
+        mock_client.send.assert_called_with(
+            "input_sequence",
+            {
+                "steps": [
+                    {"type": "action", "action": "move_right", "pressed": True},
+                    {"type": "wait_ms", "ms": 300},
+                    {"type": "action", "action": "move_right", "pressed": False},
+                    {"type": "wait_ms", "ms": 100},
+                    {"type": "screenshot"},
+                ]
+            },
+            timeout=30.4,
+        )
+
+    @pytest.mark.asyncio
+    async def test_act_and_screenshot_without_capture(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"data": None}
+        result = await mock_godot.act_and_screenshot("jump", duration=0.1, screenshot=False)
+        assert result is None
+        steps = mock_client.send.call_args[0][1]["steps"]
+        assert all(step["type"] != "screenshot" for step in steps)
+
+    @pytest.mark.asyncio
+    async def test_save_last_screenshot_reuses_capture(
+        self, mock_godot, mock_client, tmp_path
+    ) -> None:
+        png_data = b"\x89PNG\r\n\x1a\n..."
+        mock_client.send.return_value = {"data": png_data}
+        await mock_godot.screenshot()
+        mock_client.send.reset_mock()
+
+        file_path = tmp_path / "saved.png"
+        mock_godot.save_last_screenshot(str(file_path))
+
+        assert file_path.read_bytes() == png_data
+        assert mock_godot.last_screenshot == png_data
+        mock_client.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_last_screenshot_without_capture(self, mock_godot) -> None:
+        with pytest.raises(RuntimeError) as exc:
+            mock_godot.save_last_screenshot("out.png")
+        assert "No screenshot" in str(exc.value)
+
+    @pytest.mark.asyncio
+    async def test_compare_screenshot_phash_identical(self, mock_godot) -> None:
+        import io
+
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (64, 64), (128, 32, 200)).save(buf, format="PNG")
+        png = buf.getvalue()
+
+        similarity = await mock_godot.compare_screenshot(png, png, method="phash")
+        assert similarity == 1.0
+
+    @pytest.mark.asyncio
+    async def test_compare_screenshot_identical_bytes_skip_decode(self, mock_godot) -> None:
+        # Not valid PNG data: equality must short-circuit before decoding.
+        data = b"identical-but-not-an-image"
+        similarity = await mock_godot.compare_screenshot(data, data, method="pixel")
+        assert similarity == 1.0
+
+    @pytest.mark.asyncio
+    async def test_compare_screenshot_reference_decoded_once(self, mock_godot, tmp_path) -> None:
+        import io
+
+        from PIL import Image
+
+        from playgodot.godot import _load_reference
+
+        _load_reference.cache_clear()
+        ref_path = tmp_path / "ref.png"
+        Image.new("RGB", (8, 8), (10, 20, 30)).save(ref_path, format="PNG")
+        buf = io.BytesIO()
+        Image.new("RGB", (8, 8), (10, 20, 40)).save(buf, format="PNG")
+        actual = buf.getvalue()
+
+        await mock_godot.compare_screenshot(str(ref_path), actual)
+        await mock_godot.compare_screenshot(str(ref_path), actual)
+        assert _load_reference.cache_info().hits == 1
+        assert _load_reference.cache_info().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_screenshot_downsampled(self, mock_godot) -> None:
+        import io
+
+        from PIL import Image
+
+        def png(color: tuple[int, int, int]) -> bytes:
+            buf = io.BytesIO()
+            Image.new("RGB", (64, 64), color).save(buf, format="PNG")
+            return buf.getvalue()
+
+        similarity = await mock_godot.compare_screenshot(
+            png((0, 0, 0)), png((0, 0, 8)), scale=4
+        )
+        assert 0.99 < similarity < 1.0
+
+    @pytest.mark.asyncio
+    async def test_similarity_histogram_matches_numpy_path(self, mock_godot) -> None:
+        from PIL import Image
+
+        img1 = Image.new("RGBA", (32, 32), (100, 150, 200, 255))
+        img2 = Image.new("RGBA", (32, 32), (110, 150, 190, 255))
+
+        numpy_score = mock_godot._calculate_image_similarity(img1, img2)
+        histogram_score = mock_godot._similarity_histogram(img1, img2)
+        assert abs(numpy_score - histogram_score) < 1e-9
+
+    @pytest.mark.asyncio
+    async def test_compare_screenshot_unknown_method(self, mock_godot) -> None:
+        with pytest.raises(ValueError) as exc:
+            await mock_godot.compare_screenshot(b"png", b"png", method="ssim")
+        assert "Unknown comparison method" in str(exc.value)
+
+    @pytest.mark.asyncio
+    async def test_compare_screenshot_phash_missing_file(self, mock_godot, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            await mock_godot.compare_screenshot(
+                str(tmp_path / "missing.png"), b"png", method="phash"
+            )
+
 
 class TestWaitForSignal:
     """Tests for wait_for_signal method."""
@@ -463,3 +896,283 @@ class TestWaitForSignal:
             {"signal": "done", "source": "", "timeout": 10000},
             timeout=15.0,
         )
+
+
+class TestWaitForNode:
+    """Tests for the push-based wait_for_node."""
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {
+            "node": {"path": "/root/Main/Player", "name": "Player"}
+        }
+        node = await mock_godot.wait_for_node("/root/Main/Player", timeout=3.0)
+        assert node.path == "/root/Main/Player"
+        mock_client.send.assert_called_once_with(
+            "wait_node", {"path": "/root/Main/Player", "timeout": 3000}, timeout=8.0
+        )
+
+    @pytest.mark.asyncio
+    async def test_null_result_raises_timeout(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {"node": None}
+        with pytest.raises(TimeoutError, match="not found"):
+            await mock_godot.wait_for_node("/root/Missing", timeout=1.0)
+
+
+class TestWaitForSceneReady:
+    """Tests for wait_for_scene_ready and the ready-node cache."""
+
+    @pytest.mark.asyncio
+    async def test_caches_announced_nodes(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {
+            "signal": "scene_ready",
+            "args": [{"player": "/root/Main/Player", "hud": "/root/Main/HUD"}],
+        }
+        await mock_godot.wait_for_scene_ready(source="/root/Main")
+
+        mock_client.send.reset_mock()
+        node = await mock_godot.wait_for_node("/root/Main/Player")
+        assert node.path == "/root/Main/Player"
+        mock_client.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_path_still_queried(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {
+            "signal": "scene_ready",
+            "args": [{"player": "/root/Main/Player"}],
+        }
+        await mock_godot.wait_for_scene_ready()
+
+        mock_client.send.return_value = {"node": {"name": "Other"}}
+        await mock_godot.wait_for_node("/root/Main/Other")
+        mock_client.send.assert_called_with(
+            "wait_node", {"path": "/root/Main/Other", "timeout": 5000}, timeout=10.0
+        )
+
+    @pytest.mark.asyncio
+    async def test_reload_scene_clears_cache(self, mock_godot, mock_client) -> None:
+        mock_client.send.return_value = {
+            "signal": "scene_ready",
+            "args": [{"player": "/root/Main/Player"}],
+        }
+        await mock_godot.wait_for_scene_ready()
+        await mock_godot.reload_scene()
+
+        mock_client.send.return_value = {"node": {"name": "Player"}}
+        await mock_godot.wait_for_node("/root/Main/Player")
+        mock_client.send.assert_called_with(
+            "wait_node", {"path": "/root/Main/Player", "timeout": 5000}, timeout=10.0
+        )
+
+
+class TestAdaptiveIntervals:
+    """Tests for the default wait_for polling schedule."""
+
+    def test_starts_fast_then_backs_off_to_ceiling(self) -> None:
+        import itertools
+
+        schedule = list(itertools.islice(_adaptive_intervals(), 16))
+        for value in schedule[:8]:
+            assert 0.0045 <= value <= 0.0055, "Early polls should be ~5 ms"
+        for value in schedule:
+            assert value <= 0.05 * 1.1, "Schedule should cap at ~50 ms"
+        assert max(schedule[8:]) > 0.04, "Later polls should back off toward the ceiling"
+
+    @pytest.mark.asyncio
+    async def test_explicit_interval_still_honored(self, mock_godot) -> None:
+        polls = iter([False, True])
+
+        async def condition() -> bool:
+            return next(polls)
+
+        result = await mock_godot.wait_for(condition, timeout=1.0, interval=0.01)
+        assert result is True
+
+
+class TestConnectionPool:
+    """Tests for the refcounted client pool behind Godot.connect."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_pool(self):
+        Godot._pool.clear()
+        yield
+        Godot._pool.clear()
+
+    @pytest.fixture
+    def fake_client_cls(self, monkeypatch):
+        created = []
+
+        class FakeClient:
+            def __init__(self, host, port):
+                self.host = host
+                self.port = port
+                self.is_connected = False
+                self.disconnect_calls = 0
+                created.append(self)
+
+            async def connect(self, timeout=30.0):
+                self.is_connected = True
+
+            async def disconnect(self):
+                self.disconnect_calls += 1
+                self.is_connected = False
+
+        monkeypatch.setattr("playgodot.godot.NativeClient", FakeClient)
+        return created
+
+    @pytest.mark.asyncio
+    async def test_connect_reuses_pooled_client(self, fake_client_cls) -> None:
+        g1 = await Godot.connect(port=6099)
+        g2 = await Godot.connect(port=6099)
+        assert len(fake_client_cls) == 1
+        assert g1._client is g2._client
+
+    @pytest.mark.asyncio
+    async def test_disconnect_closes_on_last_reference(self, fake_client_cls) -> None:
+        g1 = await Godot.connect(port=6099)
+        g2 = await Godot.connect(port=6099)
+        client = fake_client_cls[0]
+
+        await g1.disconnect()
+        assert client.disconnect_calls == 0, "First disconnect should only decrement"
+        await g2.disconnect()
+        assert client.disconnect_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_distinct_ports_get_distinct_clients(self, fake_client_cls) -> None:
+        await Godot.connect(port=6099)
+        await Godot.connect(port=6100)
+        assert len(fake_client_cls) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_pool_disconnects_everything(self, fake_client_cls) -> None:
+        await Godot.connect(port=6099)
+        await Godot.connect(port=6100)
+        await Godot.close_pool()
+        assert all(c.disconnect_calls == 1 for c in fake_client_cls)
+        assert not Godot._pool
+
+
+class TestCleanups:
+    """Tests for add_cleanup / AsyncExitStack teardown."""
+
+    @pytest.mark.asyncio
+    async def test_cleanups_run_lifo_on_disconnect(self, mock_godot) -> None:
+        order = []
+
+        async def first():
+            order.append("first")
+
+        async def second():
+            order.append("second")
+
+        await mock_godot.add_cleanup(first)
+        await mock_godot.add_cleanup(second)
+        await mock_godot.disconnect()
+        assert order == ["second", "first"]
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_cleanup(self, mock_godot) -> None:
+        events = []
+
+        class Resource:
+            async def __aenter__(self):
+                events.append("enter")
+                return self
+
+            async def __aexit__(self, *exc):
+                events.append("exit")
+
+        await mock_godot.add_cleanup(Resource())
+        assert events == ["enter"], "CM should be entered on registration"
+        await mock_godot.disconnect()
+        assert events == ["enter", "exit"]
+
+
+class TestSingleFlight:
+    """Tests for coalescing of concurrent identical read requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_property_shares_one_send(
+        self, mock_godot, mock_client
+    ) -> None:
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_send(method, params, **kwargs):
+            await release.wait()
+            return {"value": 42}
+
+        mock_client.send = AsyncMock(side_effect=slow_send)
+
+        tasks = [
+            asyncio.ensure_future(mock_godot.get_property("/root/Main", "score"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == [42] * 5
+        assert mock_client.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_different_keys_do_not_coalesce(self, mock_godot, mock_client) -> None:
+        import asyncio
+
+        mock_client.send = AsyncMock(return_value={"value": 1})
+        await asyncio.gather(
+            mock_godot.get_property("/root/Main", "score"),
+            mock_godot.get_property("/root/Main", "lives"),
+        )
+        assert mock_client.send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self, mock_godot, mock_client) -> None:
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def failing_send(method, params, **kwargs):
+            await release.wait()
+            raise NodeNotFoundError("/root/Missing")
+
+        mock_client.send = AsyncMock(side_effect=failing_send)
+
+        tasks = [
+            asyncio.ensure_future(mock_godot.node_exists("/root/Missing"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        assert results == [False, False, False]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_does_not_cancel_others(
+        self, mock_godot, mock_client
+    ) -> None:
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_send(method, params, **kwargs):
+            await release.wait()
+            return {"value": 7}
+
+        mock_client.send = AsyncMock(side_effect=slow_send)
+
+        tasks = [
+            asyncio.ensure_future(mock_godot.get_property("/root/Main", "score"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert results[0] == 7
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert results[2] == 7
@@ -31,10 +31,6 @@ class TestNativeClientInit:
         client = NativeClient()
         assert client._pending == {}
 
-    def test_initial_request_id_zero(self) -> None:
-        client = NativeClient()
-        assert client._request_id == 0
-
     def test_initial_godot_thread_id_zero(self) -> None:
         client = NativeClient()
         assert client._godot_thread_id == 0
@@ -292,6 +288,133 @@ class TestNativeClientAsync:
             await client.send("get_tree")
         assert "Not connected" in str(exc.value)
 
+    @pytest.mark.asyncio
+    async def test_send_nowait_not_connected_raises(self) -> None:
+        client = NativeClient()
+        with pytest.raises(ConnectionError) as exc:
+            await client.send_nowait("time_scale", {"scale": 1.0})
+        assert "Not connected" in str(exc.value)
+
+    @pytest.mark.asyncio
+    async def test_send_nowait_writes_without_pending(self) -> None:
+        client = NativeClient()
+        client._reader = MagicMock()
+        client._writer = MagicMock()
+        client._writer.drain = AsyncMock()
+
+        await client.send_nowait("time_scale", {"scale": 1.0})
+
+        client._writer.write.assert_called_once()
+        client._writer.drain.assert_awaited_once()
+        assert client._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_send_nowait_response_does_not_resolve_later_send(self) -> None:
+        client = NativeClient()
+        client._reader = MagicMock()
+        client._writer = MagicMock()
+        client._writer.drain = AsyncMock()
+
+        # Fire-and-forget call whose ack arrives later.
+        await client.send_nowait("call_method", {"path": "/root/Main", "method": "reset"})
+
+        # A same-named request is now in flight.
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        client._pending["automation:call_result"] = future
+
+        # The stale ack must be discarded, not matched to the pending send.
+        await client._handle_response("automation:call_result", [None])
+        assert not future.done()
+
+        # The real response still resolves the request.
+        await client._handle_response("automation:call_result", [42])
+        assert future.result() == [42]
+        assert client._discard_counts == {}
+
+    @pytest.mark.asyncio
+    async def test_nowait_sequence_result_does_not_satisfy_next_sequence(self) -> None:
+        # A wait=False input sequence (hold_action/swipe/...) finishes up
+        # to its full duration later; its sequence_result must not be
+        # mistaken for the result of a following act_and_screenshot.
+        client = NativeClient()
+        client._reader = MagicMock()
+        client._writer = MagicMock()
+        client._writer.drain = AsyncMock()
+
+        await client.send_nowait("input_sequence", {"steps": []})
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        client._pending["automation:sequence_result"] = future
+
+        await client._handle_response("automation:sequence_result", [None])
+        assert not future.done()
+
+        png = b"\x89PNG..."
+        await client._handle_response("automation:sequence_result", [png])
+        assert future.result() == [png]
+
+    @pytest.mark.asyncio
+    async def test_send_batch_maps_commands_to_ops(self) -> None:
+        client = NativeClient()
+        client.send = AsyncMock(return_value={"results": [42, 1.5]})
+
+        results = await client.send_batch([
+            ("call_method", {"path": "/root/Main", "method": "get_score"}),
+            ("get_property", {"path": "/root/Main/Player", "property": "speed"}),
+        ])
+
+        assert results == [42, 1.5]
+        client.send.assert_awaited_once_with(
+            "batch",
+            {
+                "ops": [
+                    {
+                        "op": "call",
+                        "path": "/root/Main",
+                        "method": "get_score",
+                        "args": [],
+                    },
+                    {"op": "get", "path": "/root/Main/Player", "property": "speed"},
+                ]
+            },
+            timeout=30.0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_batch_rejects_non_batchable(self) -> None:
+        client = NativeClient()
+        with pytest.raises(ValueError) as exc:
+            await client.send_batch([("screenshot", {})])
+        assert "not batchable" in str(exc.value)
+
+    def test_set_tcp_nodelay(self) -> None:
+        import socket
+
+        writer = MagicMock()
+        sock = MagicMock()
+        writer.get_extra_info.return_value = sock
+
+        NativeClient._set_tcp_nodelay(writer)
+
+        sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def test_set_tcp_nodelay_no_socket(self) -> None:
+        writer = MagicMock()
+        writer.get_extra_info.return_value = None
+        NativeClient._set_tcp_nodelay(writer)  # Should not raise
+
+    @pytest.mark.asyncio
+    async def test_fail_pending_raises_in_waiters(self) -> None:
+        client = NativeClient()
+        future = asyncio.get_event_loop().create_future()
+        client._pending["automation:call_result"] = future
+
+        client._fail_pending(ConnectionError("Godot closed the connection"))
+
+        assert client._pending == {}
+        with pytest.raises(ConnectionError):
+            future.result()
+
     @pytest.mark.asyncio
     async def test_is_connected_true(self) -> None:
         client = NativeClient()
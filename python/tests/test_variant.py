@@ -659,6 +659,16 @@ class TestMessageEncoding:
         assert thread_id == 123
         assert data == ["data"]
 
+    def test_encode_message_prefix_cached(self) -> None:
+        from playgodot.variant import _MESSAGE_PREFIX_CACHE
+
+        _MESSAGE_PREFIX_CACHE.clear()
+        first = encode_message("automation:get_tree", 7, [])
+        assert ("automation:get_tree", 7) in _MESSAGE_PREFIX_CACHE
+        # Cached prefix must produce byte-identical output
+        second = encode_message("automation:get_tree", 7, [])
+        assert second == first
+
     def test_decode_message_invalid_format(self) -> None:
         # Non-3-element array
         encoder = VariantEncoder()
@@ -0,0 +1,100 @@
+"""Tests for the perceptual hashing helpers."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from playgodot import visual
+
+
+def _png(color, size=(64, 64)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _gradient_png(size=(64, 64)) -> bytes:
+    img = Image.new("L", size)
+    img.putdata([(x * 255) // size[0] for _ in range(size[1]) for x in range(size[0])])
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestPhash:
+    """Tests for phash and the similarity helpers."""
+
+    def test_identical_bytes_same_hash(self) -> None:
+        data = _gradient_png()
+        assert visual.phash(data) == visual.phash(data)
+
+    def test_different_images_differ(self) -> None:
+        assert visual.phash(_gradient_png()) != visual.phash(_gradient_png((32, 32)))
+
+    def test_hash_is_64_bit(self) -> None:
+        assert 0 <= visual.phash(_gradient_png()) < 2**64
+
+    def test_path_input(self, tmp_path) -> None:
+        ref = tmp_path / "ref.png"
+        ref.write_bytes(_gradient_png())
+        assert visual.phash(ref) == visual.phash(ref.read_bytes())
+
+    def test_path_hash_cached_until_mtime_changes(self, tmp_path, monkeypatch) -> None:
+        ref = tmp_path / "ref.png"
+        ref.write_bytes(_gradient_png())
+
+        calls = 0
+        real = visual._phash_bytes
+
+        def counting(data):
+            nonlocal calls
+            calls += 1
+            return real(data)
+
+        monkeypatch.setattr(visual, "_phash_bytes", counting)
+        visual.phash(ref)
+        visual.phash(ref)
+        assert calls == 1
+
+    def test_hamming_and_similarity(self) -> None:
+        assert visual.hamming(0b1010, 0b1010) == 0
+        assert visual.hamming(0b1010, 0b0101) == 4
+        assert visual.similarity(0b1010, 0b1010) == 1.0
+        assert visual.similarity(0, 2**64 - 1) == 0.0
+
+    def test_similar_images_close(self) -> None:
+        a = visual.phash(_gradient_png((64, 64)))
+        b = visual.phash(_gradient_png((66, 64)))
+        assert visual.hamming(a, b) <= 5
+
+    def test_missing_path_raises(self, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            visual.phash(tmp_path / "missing.png")
+
+
+class TestReferenceIndex:
+    """Tests for the BK-tree reference lookup."""
+
+    def test_nearest_finds_exact_match(self, tmp_path) -> None:
+        (tmp_path / "red.png").write_bytes(_png((255, 0, 0)))
+        (tmp_path / "gradient.png").write_bytes(_gradient_png())
+
+        index = visual.ReferenceIndex(tmp_path)
+        path, distance = index.nearest(_gradient_png())
+
+        assert path.name == "gradient.png"
+        assert distance == 0
+
+    def test_nearest_ignores_non_images(self, tmp_path) -> None:
+        (tmp_path / "gradient.png").write_bytes(_gradient_png())
+        (tmp_path / "notes.txt").write_text("not an image")
+
+        index = visual.ReferenceIndex(tmp_path)
+        path, _ = index.nearest(_gradient_png())
+        assert path.name == "gradient.png"
+
+    def test_empty_directory_raises(self, tmp_path) -> None:
+        index = visual.ReferenceIndex(tmp_path)
+        with pytest.raises(LookupError):
+            index.nearest(_gradient_png())